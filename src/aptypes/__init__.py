@@ -2,7 +2,10 @@
 
 """
 
-__all__ = [ "APFixed", "APUfixed", "APComplex", "APUcomplex", "real", "complex" ]
+__all__ = [ "APFixed", "APUfixed", "APFixedArray",
+            "APComplex", "APUcomplex", "APComplexArray",
+            "real", "complex" ]
 
-from .real import APFixed, APUfixed
-from .complex import APComplex, APUcomplex
+from . import real, complex
+from .real import APFixed, APUfixed, APFixedArray
+from .complex import APComplex, APUcomplex, APComplexArray
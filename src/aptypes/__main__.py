@@ -1,4 +1,5 @@
 from itertools import product as cartesian
+import operator
 import sys
 import os
 import hashlib
@@ -7,42 +8,50 @@ import numpy
 
 from . import *
 
+_OPS = {'+': operator.add, '-': operator.sub, '*': operator.mul}
+
 def pretty_print(a, b, file = sys.stdout):
     print(a, ':', b, file = file)
 
-def pretty_print_couple(expr, file = sys.stdout):
-    val_b = eval(expr)
-    pretty_print(expr, '(' + str(val_b[0]) + ', ' + str(val_b[1]) + ')', file = file)
+def pretty_print_couple(expr, val_b, file = sys.stdout):
+    print(f'{expr} : ({val_b[0]}, {val_b[1]})', file = file)
     return val_b
 
-def check_equalty(expr, file = sys.stdout):
-    val_x = pretty_print_couple(expr, file = file)
+def check_equalty(expr, val_x, file = sys.stdout):
+    pretty_print_couple(expr, val_x, file = file)
     print(' -- ', val_x[0] == val_x[1].value, file = file)
 
+def check_batch(labels, val_ref, val_ap, file = sys.stdout):
+    lines = [f'{label} : ({ref}, {val_x})\n --  {ref == val_x.value}'
+             for label, ref, val_x in zip(labels, val_ref.tolist(), val_ap)]
+    if lines:
+        print('\n'.join(lines), file = file)
+
+def check_identity(expr, val_ref, val_x, file = sys.stdout):
+    pretty_print_couple(expr, (val_ref, val_x), file = file)
+    print(' -- ', repr(val_ref) == repr(val_x), file = file)
+
 def tuple_former(x, c, W, I):
     return (x, c(x, W, I))
 
 def tuple_auto_bits(x, c):
     return tuple_former(x, c, None, None)
 
-def auto_eval_tuple(x: tuple, y: tuple, f):
-    return (eval(f'x[0] {f} y[0]'), eval(f'x[1] {f} y[1]'))
-
 def test_run(seed = 0, file = sys.stdout):
     rng = numpy.random.default_rng(seed = seed)
 
-    a0 = eval((val_s := 'tuple_auto_bits(562.4, APFixed)'))
-    pretty_print_couple(val_s, file = file)
-    a1 = eval((val_s := 'tuple_auto_bits(562.4, APUfixed)'))
-    pretty_print_couple(val_s, file = file)
-    a2 = eval((val_s := 'tuple_former(156.21, APUfixed, 12, None)'))
-    pretty_print_couple(val_s, file = file)
-    b0 = eval((val_s := 'tuple_auto_bits(-89., APFixed)'))
-    pretty_print_couple(val_s, file = file)
-    b1 = eval((val_s := 'tuple_auto_bits(-9.9654, APFixed)'))
-    pretty_print_couple(val_s, file = file)
-    b2 = eval((val_s := 'tuple_former(156.21, APFixed, 12, None)'))
-    pretty_print_couple(val_s, file = file)
+    a0 = pretty_print_couple('tuple_auto_bits(562.4, APFixed)',
+                             tuple_auto_bits(562.4, APFixed), file = file)
+    a1 = pretty_print_couple('tuple_auto_bits(562.4, APUfixed)',
+                             tuple_auto_bits(562.4, APUfixed), file = file)
+    a2 = pretty_print_couple('tuple_former(156.21, APUfixed, 12, None)',
+                             tuple_former(156.21, APUfixed, 12, None), file = file)
+    b0 = pretty_print_couple('tuple_auto_bits(-89., APFixed)',
+                             tuple_auto_bits(-89., APFixed), file = file)
+    b1 = pretty_print_couple('tuple_auto_bits(-9.9654, APFixed)',
+                             tuple_auto_bits(-9.9654, APFixed), file = file)
+    b2 = pretty_print_couple('tuple_former(156.21, APFixed, 12, None)',
+                             tuple_former(156.21, APFixed, 12, None), file = file)
 
     print(repr(a0[1]), file = file)
 
@@ -52,11 +61,11 @@ def test_run(seed = 0, file = sys.stdout):
     rar = tuple_former(-2, APFixed, 2, 2)
 
     vec = []
-    for a,b,o in cartesian(val_a, val_b,["'+'", "'-'", "'*'"]):
-
-        val_s = f"auto_eval_tuple({a}, {b}, {o})".replace('Signed', 'APFixed').replace('Unsigned', 'APUfixed')
+    for a,b,o in cartesian(val_a, val_b, ['+', '-', '*']):
+        op    = _OPS[o]
+        val_s = f"auto_eval_tuple({a}, {b}, {o!r})".replace('Signed', 'APFixed').replace('Unsigned', 'APUfixed')
         try:
-            vec.append(pretty_print_couple(val_s, file = file))
+            vec.append(pretty_print_couple(val_s, (op(a[0], b[0]), op(a[1], b[1])), file = file))
         #pylint: disable-next=broad-exception-caught
         except Exception:
             print(val_s, '=> Error', file = file)
@@ -71,97 +80,174 @@ def test_run(seed = 0, file = sys.stdout):
     except ValueError:
         print('ValueError successfully detected', file = file)
 
-    val_s = 'APUfixed(vec[8][1].truncate(18)).truncate(3, lsb=False)'
-    pretty_print(val_s, eval(val_s), file = file)
+    gg = APUfixed(vec[8][1].truncate(18)).truncate(3, lsb=False)
+    pretty_print('APUfixed(vec[8][1].truncate(18)).truncate(3, lsb=False)', gg, file = file)
 
     try:
-        gg = eval(val_s)
         _ = -gg
     except NotImplementedError:
         print('NotImplementedError successfully detected', file = file)
 
-    val_s = 'vec[8][1].truncate(18).saturate(14)'
-    e1    = eval(val_s)
+    e1 = vec[8][1].truncate(18).saturate(14)
     print('e1 = ', end='', file = file)
-    pretty_print(val_s, eval(val_s), file = file)
-
-    pretty_print('APUfixed(e1).saturate(1)', eval('APUfixed(e1).saturate(1)'), file = file)
-
-    val_s = 'tuple_auto_bits(-1. + 56.j, APComplex)'
-    pretty_print(val_s, eval(val_s), file = file)
-
-    val_s = 'tuple_auto_bits((-1., 56.), APComplex)'
-    pretty_print(val_s, eval(val_s), file = file)
-
-    for val_x in rng.random((20, 2)):
-        x, y = numpy.round(val_x * (2**3 - 1) * 2 - (2**3 - 1)) / 2
-        _, y = numpy.round(val_x * (2**4 - 1) * 2 - (2**4 - 1))
-        val_s = f'({x:.1f} * {y:.1f}, APFixed({x:.1f}, 4, 3) * APFixed({y:.1f}, 5, 5))'
-        check_equalty(val_s, file = file)
-
-    for val_x in rng.random((20, 4)):
-        re0, im0, _, _ = numpy.round(val_x * (2**3 - 1) * 2 - (2**3 - 1)) / 2
-        _, _, re1, im1 = numpy.round(val_x * (2**4 - 1) * 2 - (2**4 - 1))
-        val_s = f'(({re0:.1f}+{im0:.1f}j) * ({re1:.1f}+{im1:.1f}j), APComplex({re0:.1f}+{im0:.1f}j, 4, 3) * APComplex({re1:.1f}+{im1:.1f}j, 5, 5))'
-        check_equalty(val_s, file = file)
-
-    for val_x in rng.random((20, 3)):
-        re0, im0, _ = numpy.round(val_x * (2**3 - 1) * 2 - (2**3 - 1)) / 2
-        _, _, val = numpy.round(val_x * (2**4 - 1) * 2 - (2**4 - 1))
-        val_s = f'(({re0:.1f}+{im0:.1f}j) * {val:.1f}, APComplex({re0:.1f}+{im0:.1f}j, 4, 3) * APFixed({val:.1f}, 5, 5))'
-        check_equalty(val_s, file = file)
-
+    pretty_print('vec[8][1].truncate(18).saturate(14)', e1, file = file)
+
+    pretty_print('APUfixed(e1).saturate(1)', APUfixed(e1).saturate(1), file = file)
+
+    pretty_print('tuple_auto_bits(-1. + 56.j, APComplex)',
+                 tuple_auto_bits(-1. + 56.j, APComplex), file = file)
+
+    pretty_print('tuple_auto_bits((-1., 56.), APComplex)',
+                 tuple_auto_bits((-1., 56.), APComplex), file = file)
+
+    val_x = rng.random((20, 2))
+    x, _  = (numpy.round(val_x * (2**3 - 1) * 2 - (2**3 - 1)) / 2).T
+    _, y  = numpy.round(val_x * (2**4 - 1) * 2 - (2**4 - 1)).T
+    labels = [f'({x:.1f} * {y:.1f}, APFixed({x:.1f}, 4, 3) * APFixed({y:.1f}, 5, 5))'
+              for x, y in zip(x, y)]
+    check_batch(labels, x * y, APFixedArray(x, 4, 3) * APFixedArray(y, 5, 5), file = file)
+
+    val_x = rng.random((20, 4))
+    re0, im0, _, _ = (numpy.round(val_x * (2**3 - 1) * 2 - (2**3 - 1)) / 2).T
+    _, _, re1, im1 = numpy.round(val_x * (2**4 - 1) * 2 - (2**4 - 1)).T
+    z0, z1 = re0 + 1j * im0, re1 + 1j * im1
+    labels = [f'(({re0:.1f}+{im0:.1f}j) * ({re1:.1f}+{im1:.1f}j), APComplex({re0:.1f}+{im0:.1f}j, 4, 3) * APComplex({re1:.1f}+{im1:.1f}j, 5, 5))'
+              for re0, im0, re1, im1 in zip(re0, im0, re1, im1)]
+    check_batch(labels, z0 * z1, APComplexArray(z0, 4, 3) * APComplexArray(z1, 5, 5), file = file)
+
+    val_x = rng.random((20, 3))
+    re0, im0, _ = (numpy.round(val_x * (2**3 - 1) * 2 - (2**3 - 1)) / 2).T
+    _, _, val   = numpy.round(val_x * (2**4 - 1) * 2 - (2**4 - 1)).T
+    z0 = re0 + 1j * im0
+    labels = [f'(({re0:.1f}+{im0:.1f}j) * {val:.1f}, APComplex({re0:.1f}+{im0:.1f}j, 4, 3) * APFixed({val:.1f}, 5, 5))'
+              for re0, im0, val in zip(re0, im0, val)]
+    check_batch(labels, z0 * val, APComplexArray(z0, 4, 3) * APFixedArray(val, 5, 5), file = file)
+
+    # Unsigned products may be negative: each case is checked on its own to report it
     for val_x in rng.random((20, 4)):
         re0, im0, _, _ = numpy.round(val_x * (2**4 - 1)) / 2
         _, _, re1, im1 = numpy.round(val_x * (2**5 - 1))
+        z0, z1 = (re0 + 1j * im0).item(), (re1 + 1j * im1).item()
         val_s = f'(({re0:.1f}+{im0:.1f}j) * ({re1:.1f}+{im1:.1f}j), APUcomplex({re0:.1f}+{im0:.1f}j, 4, 3) * APUcomplex({re1:.1f}+{im1:.1f}j, 5, 5))'
         try:
-            check_equalty(val_s, file = file)
+            check_equalty(val_s, (z0 * z1, APUcomplex(z0, 4, 3) * APUcomplex(z1, 5, 5)), file = file)
         except ValueError:
-            pretty_print(val_s, (eval(val_s[1:].split(",")[0]), "Error: Negative result"), file = file)
-
-    for val_x in rng.random((20, 3)):
-        re0, im0, _ = numpy.round(val_x * (2**4 - 1)) / 2
-        _, _, val = numpy.round(val_x * (2**5 - 1))
-        val_s = f'(({re0:.1f}+{im0:.1f}j) * {val:.1f}, APUcomplex({re0:.1f}+{im0:.1f}j, 4, 3) * APUfixed({val:.1f}, 5, 5))'
-        check_equalty(val_s, file = file)
+            pretty_print(val_s, (z0 * z1, "Error: Negative result"), file = file)
+
+    val_x = rng.random((20, 3))
+    re0, im0, _ = (numpy.round(val_x * (2**4 - 1)) / 2).T
+    _, _, val   = numpy.round(val_x * (2**5 - 1)).T
+    z0 = re0 + 1j * im0
+    labels = [f'(({re0:.1f}+{im0:.1f}j) * {val:.1f}, APUcomplex({re0:.1f}+{im0:.1f}j, 4, 3) * APUfixed({val:.1f}, 5, 5))'
+              for re0, im0, val in zip(re0, im0, val)]
+    check_batch(labels, z0 * val,
+                APComplexArray(z0, 4, 3, signed = False) * APFixedArray(val, 5, 5, signed = False),
+                file = file)
 
     ###
 
-    for val_x in rng.random((20, 4)):
-        re0, im0, _, _ = numpy.round(val_x * (2**3 - 1) * 2 - (2**3 - 1)) / 2
-        _, _, re1, im1 = numpy.round(val_x * (2**4 - 1) * 2 - (2**4 - 1))
-        val_s = f'(({re0:.1f}+{im0:.1f}j) + ({re1:.1f}+{im1:.1f}j), APComplex({re0:.1f}+{im0:.1f}j, 4, 3) + APComplex({re1:.1f}+{im1:.1f}j, 5, 5))'
-        check_equalty(val_s, file = file)
+    val_x = rng.random((20, 4))
+    re0, im0, _, _ = (numpy.round(val_x * (2**3 - 1) * 2 - (2**3 - 1)) / 2).T
+    _, _, re1, im1 = numpy.round(val_x * (2**4 - 1) * 2 - (2**4 - 1)).T
+    z0, z1 = re0 + 1j * im0, re1 + 1j * im1
+    labels = [f'(({re0:.1f}+{im0:.1f}j) + ({re1:.1f}+{im1:.1f}j), APComplex({re0:.1f}+{im0:.1f}j, 4, 3) + APComplex({re1:.1f}+{im1:.1f}j, 5, 5))'
+              for re0, im0, re1, im1 in zip(re0, im0, re1, im1)]
+    check_batch(labels, z0 + z1, APComplexArray(z0, 4, 3) + APComplexArray(z1, 5, 5), file = file)
+
+    val_x = rng.random((20, 4))
+    re0, im0, _, _ = (numpy.round(val_x * (2**3 - 1) * 2 - (2**3 - 1)) / 2).T
+    _, _, re1, im1 = numpy.round(val_x * (2**4 - 1) * 2 - (2**4 - 1)).T
+    z0, z1 = re0 + 1j * im0, re1 + 1j * im1
+    labels = [f'(({re0:.1f}+{im0:.1f}j) - ({re1:.1f}+{im1:.1f}j), APComplex({re0:.1f}+{im0:.1f}j, 4, 3) - APComplex({re1:.1f}+{im1:.1f}j, 5, 5))'
+              for re0, im0, re1, im1 in zip(re0, im0, re1, im1)]
+    check_batch(labels, z0 - z1, APComplexArray(z0, 4, 3) - APComplexArray(z1, 5, 5), file = file)
+
+    val_x = rng.random((20, 3))
+    re0, im0, _ = (numpy.round(val_x * (2**3 - 1) * 2 - (2**3 - 1)) / 2).T
+    _, _, val   = numpy.round(val_x * (2**4 - 1) * 2 - (2**4 - 1)).T
+    z0 = re0 + 1j * im0
+    labels = [f'(({re0:.1f}+{im0:.1f}j) + {val:.1f}, APComplex({re0:.1f}+{im0:.1f}j, 4, 3) + APFixed({val:.1f}, 5, 5))'
+              for re0, im0, val in zip(re0, im0, val)]
+    check_batch(labels, z0 + val, APComplexArray(z0, 4, 3) + APFixedArray(val, 5, 5), file = file)
+
+    val_x = numpy.abs(rng.random((20, 4)))
+    re0, im0, _, _ = (numpy.round(val_x * (2**4 - 1)) / 2).T
+    _, _, re1, im1 = numpy.round(val_x * (2**5 - 1)).T
+    z0, z1 = re0 + 1j * im0, re1 + 1j * im1
+    labels = [f'(({re0:.1f}+{im0:.1f}j) + ({re1:.1f}+{im1:.1f}j), APUcomplex({re0:.1f}+{im0:.1f}j, 4, 3) + APUcomplex({re1:.1f}+{im1:.1f}j, 5, 5))'
+              for re0, im0, re1, im1 in zip(re0, im0, re1, im1)]
+    check_batch(labels, z0 + z1,
+                APComplexArray(z0, 4, 3, signed = False) + APComplexArray(z1, 5, 5, signed = False),
+                file = file)
+
+    val_x = rng.random((20, 3))
+    re0, im0, _ = (numpy.round(val_x * (2**4 - 1)) / 2).T
+    _, _, val   = numpy.round(val_x * (2**5 - 1)).T
+    z0 = re0 + 1j * im0
+    labels = [f'(({re0:.1f}+{im0:.1f}j) + {val:.1f}, APUcomplex({re0:.1f}+{im0:.1f}j, 4, 3) + APUfixed({val:.1f}, 5, 5))'
+              for re0, im0, val in zip(re0, im0, val)]
+    check_batch(labels, z0 + val,
+                APComplexArray(z0, 4, 3, signed = False) + APFixedArray(val, 5, 5, signed = False),
+                file = file)
 
-    for val_x in rng.random((20, 4)):
-        re0, im0, _, _ = numpy.round(val_x * (2**3 - 1) * 2 - (2**3 - 1)) / 2
-        _, _, re1, im1 = numpy.round(val_x * (2**4 - 1) * 2 - (2**4 - 1))
-        val_s = f'(({re0:.1f}+{im0:.1f}j) - ({re1:.1f}+{im1:.1f}j), APComplex({re0:.1f}+{im0:.1f}j, 4, 3) - APComplex({re1:.1f}+{im1:.1f}j, 5, 5))'
-        check_equalty(val_s, file = file)
-
-    for val_x in rng.random((20, 3)):
-        re0, im0, _ = numpy.round(val_x * (2**3 - 1) * 2 - (2**3 - 1)) / 2
-        _, _, val = numpy.round(val_x * (2**4 - 1) * 2 - (2**4 - 1))
-        val_s = f'(({re0:.1f}+{im0:.1f}j) + {val:.1f}, APComplex({re0:.1f}+{im0:.1f}j, 4, 3) + APFixed({val:.1f}, 5, 5))'
-        check_equalty(val_s, file = file)
-
-    for val_x in numpy.abs(rng.random((20, 4))):
-        re0, im0, _, _ = numpy.round(val_x * (2**4 - 1)) / 2
-        _, _, re1, im1 = numpy.round(val_x * (2**5 - 1))
-        val_s = f'(({re0:.1f}+{im0:.1f}j) + ({re1:.1f}+{im1:.1f}j), APUcomplex({re0:.1f}+{im0:.1f}j, 4, 3) + APUcomplex({re1:.1f}+{im1:.1f}j, 5, 5))'
-        try:
-            check_equalty(val_s, file = file)
-        except ValueError:
-            pretty_print(val_s, (eval(val_s[1:].split(",")[0]), "Error: Negative result"), file = file)
+    print(APFixed(-2**3, 4, 4, scaling='external').bitstrained_add(-1.5, 7, 5), file = file)
 
-    for val_x in rng.random((20, 3)):
-        re0, im0, _ = numpy.round(val_x * (2**4 - 1)) / 2
-        _, _, val = numpy.round(val_x * (2**5 - 1))
-        val_s = f'(({re0:.1f}+{im0:.1f}j) + {val:.1f}, APUcomplex({re0:.1f}+{im0:.1f}j, 4, 3) + APUfixed({val:.1f}, 5, 5))'
-        check_equalty(val_s, file = file)
+    vals = [1.5, -2.25, 0.125, 3.875]
+    labels = [f'({x}, APFixedArray.from_elements(...).to_elements())' for x in vals]
+    check_batch(labels, numpy.array(vals),
+                APFixedArray.from_elements([APFixed(x, 8, 3) for x in vals]).to_elements(),
+                file = file)
 
-    print(APFixed(-2**3, 4, 4, scaling='external').bitstrained_add(-1.5, 7, 5), file = file)
+    try:
+        APFixedArray.from_elements([APFixed(0, 60, 0), APFixed(100, 10, 10)])
+    except ValueError:
+        print('ValueError successfully detected', file = file)
+
+    squares = {'APFixed(-2.75, 6, 3)': APFixed(-2.75, 6, 3),
+               'APUfixed(5.5, 5, 4)': APUfixed(5.5, 5, 4),
+               'APFixed(-3**45, 80, 10)': APFixed(-3**45, 80, 10),
+               'APUfixed(3**45, 80, 10)': APUfixed(3**45, 80, 10)}
+    for label, x in squares.items():
+        check_identity(f'({label} * {label}, {label}.square())', x * x, x.square(), file = file)
+
+    fmas = {'APComplex(1.5-2j, 6, 3), APComplex(-0.75+1.25j, 5, 2), APComplex(3-1j, 6, 4)':
+                (APComplex(1.5-2j, 6, 3), APComplex(-0.75+1.25j, 5, 2), APComplex(3-1j, 6, 4)),
+            'APUcomplex(2.5+1j, 6, 3), APUcomplex(0.75+1.25j, 5, 2), APUcomplex(3+1j, 6, 4)':
+                (APUcomplex(2.5+1j, 6, 3), APUcomplex(0.75+1.25j, 5, 2), APUcomplex(3+1j, 6, 4)),
+            'APComplex(1.5-2j, 6, 3), APComplex((APFixed(-3**40, 70, 8), APFixed(5**27, 70, 8))), APComplex(-1+0.5j, 4, 2)':
+                (APComplex(1.5-2j, 6, 3), APComplex((APFixed(-3**40, 70, 8), APFixed(5**27, 70, 8))),
+                 APComplex(-1+0.5j, 4, 2)),
+            'APComplex(1.5-2j, 6, 3), APComplex(-0.75+1.25j, 5, 2), APFixed(-2.5, 5, 3)':
+                (APComplex(1.5-2j, 6, 3), APComplex(-0.75+1.25j, 5, 2), APFixed(-2.5, 5, 3))}
+    for label, (z, mul0, mul1) in fmas.items():
+        check_identity(f'z + mul0 * mul1, z.fma(mul0, mul1) with ({label})',
+                       z + mul0 * mul1, z.fma(mul0, mul1), file = file)
+
+    magns = {('APComplex', APComplex, 6, 3):   [1.5-2j, -0.25+3j, -4-4j],
+             ('APUcomplex', APUcomplex, 6, 3):  [1.5+2j, 0.25+3j, 7.875+7.875j],
+             ('APComplex', APComplex, 40, 20): [-524288+1j, 3.141592653589793-2.718281828459045j]}
+    for (name, cls, width, integer), vals in magns.items():
+        z_x = [cls(x, width, integer) for x in vals]
+        m_x = cls.magn_batch(numpy.array([x.real.raw for x in z_x]),
+                             numpy.array([x.imag.raw for x in z_x]), width, integer)
+        for i, (x, z) in enumerate(zip(vals, z_x)):
+            check_identity(f'({name}({x}, {width}, {integer}).magn(), '
+                           f'{name}.magn_batch(...)[{i}])', z.magn(), m_x[i], file = file)
+
+    batches = {('APFixed', APFixed, 10, 4):     [1.5, -2.25, 0.1, -7.96875],
+               ('APUfixed', APUfixed, 10, 4):   [1.5, 2.25, 0.1, 15.96875],
+               ('APFixed', APFixed, None, None): [562.4, -89., -9.9654, 0.]}
+    for (name, cls, width, integer), vals in batches.items():
+        a_x = cls.from_array(vals, width, integer)
+        for i, x in enumerate(vals):
+            check_identity(f'({name}({x}, {a_x.bit_width}, {a_x.bit_int}), '
+                           f'{name}.from_array({vals}, {width}, {integer})[{i}])',
+                           cls(x, a_x.bit_width, a_x.bit_int), a_x[i], file = file)
+
+    try:
+        APComplex((APFixed(0.5, 20, 10), APFixed(3.0, 20, 3)), 18)
+    except ValueError:
+        print('ValueError successfully detected', file = file)
 
     print('ok', file = file)
 
@@ -170,7 +256,7 @@ def log(file: str):
         test_run(seed = 4568, file = f)
 
 if __name__ == '__main__':
-    ORIGINAL_SHA256 = 'f305e3e4baa658729a24290dd98e8cc2cb78b0de996036b12a2cd082ce8167d8'
+    ORIGINAL_SHA256 = 'be85881e5219d22b68d5ac7bb368e21cf2d10f516e669fa765cad00212ef14ac'
 
     log('output.dat')
 
@@ -0,0 +1,146 @@
+"""Arithmetic kernels operating on raw integer values
+
+"""
+
+# Raw bit length above which a multiplication by a power of two is applied as a shift
+_WIDE_BITS = 64
+
+def mul_raw(raw0: int, raw1: int) -> int:
+    """Real multiplication of raw values
+
+    When one operand is wide and the other is a signed power of two, the product is
+    computed as a shift of the wide operand.
+
+    Args:
+        raw0 (int): raw value of the first operand
+        raw1 (int): raw value of the second operand
+
+    Returns:
+        int: raw value of the product, whose number of quotient bits is the sum of the
+            operands' ones
+    """
+    if raw0.bit_length() > _WIDE_BITS or raw1.bit_length() > _WIDE_BITS:
+        if raw0.bit_length() > raw1.bit_length():
+            raw0, raw1 = raw1, raw0
+        magn = abs(raw0)
+        if magn and not magn & (magn - 1):
+            prod = raw1 << (magn.bit_length() - 1)
+            return prod if raw0 > 0 else -prod
+    return raw0 * raw1
+
+def cmul_raw(re0: int, im0: int, re1: int, im1: int) -> tuple:
+    """Complex multiplication of raw values
+
+    Args:
+        re0 (int): raw value of the real part of the first operand
+        im0 (int): raw value of the imaginary part of the first operand
+        re1 (int): raw value of the real part of the second operand
+        im1 (int): raw value of the imaginary part of the second operand
+
+    Returns:
+        tuple: raw values of the real and imaginary parts of the product, whose number
+            of quotient bits is the sum of the operands' ones
+    """
+    return re0 * re1 - im0 * im1, re0 * im1 + im0 * re1
+
+# Operand bit width from which the 3-multiplication complex product is faster
+CMUL3_MIN_BITS = 256
+
+def cmul3_raw(re0: int, im0: int, re1: int, im1: int) -> tuple:
+    """Complex multiplication of raw values, using 3 multiplications (Gauss' trick)
+
+    Exactly equal to `cmul_raw`, but trades a multiplication for 3 additions: only faster
+    for wide operands, see `CMUL3_MIN_BITS`.
+
+    Args:
+        re0 (int): raw value of the real part of the first operand
+        im0 (int): raw value of the imaginary part of the first operand
+        re1 (int): raw value of the real part of the second operand
+        im1 (int): raw value of the imaginary part of the second operand
+
+    Returns:
+        tuple: raw values of the real and imaginary parts of the product, whose number
+            of quotient bits is the sum of the operands' ones
+    """
+    prod = re1 * (re0 + im0)
+    return prod - im0 * (re1 + im1), prod + re0 * (im1 - re1)
+
+def cadd_raw(re0: int, im0: int, shift0: int, re1: int, im1: int, shift1: int) -> tuple:
+    """Complex addition of raw values
+
+    Args:
+        re0 (int): raw value of the real part of the first operand
+        im0 (int): raw value of the imaginary part of the first operand
+        shift0 (int): left shift aligning the first operand on the result fixed point
+        re1 (int): raw value of the real part of the second operand
+        im1 (int): raw value of the imaginary part of the second operand
+        shift1 (int): left shift aligning the second operand on the result fixed point
+
+    Returns:
+        tuple: raw values of the real and imaginary parts of the sum
+    """
+    return (re0 << shift0) + (re1 << shift1), (im0 << shift0) + (im1 << shift1)
+
+def csub_raw(re0: int, im0: int, shift0: int, re1: int, im1: int, shift1: int) -> tuple:
+    """Complex substraction of raw values
+
+    Args:
+        re0 (int): raw value of the real part of the first operand
+        im0 (int): raw value of the imaginary part of the first operand
+        shift0 (int): left shift aligning the first operand on the result fixed point
+        re1 (int): raw value of the real part of the second operand
+        im1 (int): raw value of the imaginary part of the second operand
+        shift1 (int): left shift aligning the second operand on the result fixed point
+
+    Returns:
+        tuple: raw values of the real and imaginary parts of the difference
+    """
+    return (re0 << shift0) - (re1 << shift1), (im0 << shift0) - (im1 << shift1)
+
+def shift_raw(raw: int, shift: int) -> int:
+    """Scale a raw value by a power of two
+
+    Args:
+        raw (int): raw value to scale
+        shift (int): the power of two, negative when quotient bits are dropped
+
+    Returns:
+        int: raw left-shifted by shift when shift is non-negative, otherwise
+            raw divided by 2**-shift and truncated toward zero
+    """
+    if shift >= 0:
+        return raw << shift
+    return raw >> -shift if raw >= 0 else -(-raw >> -shift)
+
+def add_raw(raw0: int, shift0: int, raw1: int, shift1: int) -> int:
+    """Real addition of raw values
+
+    Args:
+        raw0 (int): raw value of the first operand
+        shift0 (int): shift aligning the first operand on the result fixed point
+        raw1 (int): raw value of the second operand
+        shift1 (int): shift aligning the second operand on the result fixed point
+
+    Returns:
+        int: raw value of the sum
+    """
+    if shift0 >= 0 and shift1 >= 0:
+        # Common case: both operands are aligned on a wider fixed point
+        return (raw0 << shift0) + (raw1 << shift1)
+    return shift_raw(raw0, shift0) + shift_raw(raw1, shift1)
+
+def sub_raw(raw0: int, shift0: int, raw1: int, shift1: int) -> int:
+    """Real substraction of raw values
+
+    Args:
+        raw0 (int): raw value of the first operand
+        shift0 (int): shift aligning the first operand on the result fixed point
+        raw1 (int): raw value of the second operand
+        shift1 (int): shift aligning the second operand on the result fixed point
+
+    Returns:
+        int: raw value of the difference
+    """
+    if shift0 >= 0 and shift1 >= 0:
+        return (raw0 << shift0) - (raw1 << shift1)
+    return shift_raw(raw0, shift0) - shift_raw(raw1, shift1)
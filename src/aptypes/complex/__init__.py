@@ -2,12 +2,15 @@
 
 """
 
-__all__ = [ "ap_complex", "ap_ucomplex" ]
+__all__ = [ "Base", "Signed", "Unsigned", "Array",
+            "APComplex", "APUcomplex", "APComplexArray" ]
 
 from .ap_complex_base import Base
 from .ap_complex import Signed 
 from .ap_ucomplex import Unsigned
+from .ap_complex_array import Array
 
 # Some common aliases
 APComplex  = Signed
 APUcomplex = Unsigned
+APComplexArray = Array
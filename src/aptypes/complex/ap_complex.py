@@ -1,3 +1,4 @@
+from .. import real
 from .ap_complex_base import Base
 
 class Signed(Base):
@@ -5,6 +6,7 @@ class Signed(Base):
 
     """
 
-    @classmethod
-    def _signed(cls) -> bool:
-        return True
+    __slots__ = ()
+
+    _SIGNED     = True
+    _ROOT_CLASS = real.Signed
@@ -0,0 +1,310 @@
+from __future__ import annotations
+import numpy
+
+from .. import real
+from .ap_complex_base import Base
+from .ap_complex import Signed
+from .ap_ucomplex import Unsigned
+
+class Array:
+    """Batch of complex fixed-point arbitrary-precision numbers sharing a single format
+
+    Real and imaginary parts are stored separately (structure of arrays) as two
+    `real.Array`, so that arithmetics operate on whole batches at once.
+
+    """
+
+    __slots__ = ('__re', '__im')
+
+    # Scalar type of the elements, indexed by signedness
+    _ROOT_CLASSES = {True: Signed, False: Unsigned}
+
+    @property
+    def signed(self) -> bool:
+        """Signed type indicator
+
+        Returns:
+            bool: whether the elements are signed or not
+        """
+        return self.__re.signed
+
+    @property
+    def root_class(self) -> type:
+        """Scalar type of the elements
+
+        Returns:
+            type: the scalar complex `Base` derivative matching the signedness
+        """
+        return self._ROOT_CLASSES[self.__re.signed]
+
+    @property
+    def bit_width(self) -> int:
+        """Bit width of real and imaginary parts
+
+        Returns:
+            int: arbitrary length in bits
+        """
+        return self.__re.bit_width
+
+    @property
+    def bit_int(self) -> int:
+        """Integer bits of real and imaginary parts
+
+        Returns:
+            int: arbitrary number of bits above the fixed point
+        """
+        return self.__re.bit_int
+
+    @property
+    def bit_quote(self) -> int:
+        """Quotient bits of real and imaginary parts
+
+        Returns:
+            int: arbitrary number of bits below the fixed point
+        """
+        return self.__re.bit_quote
+
+    @property
+    def real(self) -> real.Array:
+        """The real parts
+
+        Returns:
+            real.Array: the fixed-point real parts
+        """
+        return self.__re
+
+    @property
+    def imag(self) -> real.Array:
+        """The imaginary parts
+
+        Returns:
+            real.Array: the fixed-point imaginary parts
+        """
+        return self.__im
+
+    @property
+    def re_raw(self) -> numpy.ndarray:
+        """Raw values of the real parts
+
+        Returns:
+            numpy.ndarray: internal raw values of the real parts
+        """
+        return self.__re.raw
+
+    @property
+    def im_raw(self) -> numpy.ndarray:
+        """Raw values of the imaginary parts
+
+        Returns:
+            numpy.ndarray: internal raw values of the imaginary parts
+        """
+        return self.__im.raw
+
+    @property
+    def value(self) -> numpy.ndarray:
+        """the conceptual values hold by the batch
+
+        Returns:
+            numpy.ndarray: floating-point values of the complex-numbers
+        """
+        return self.real.value + 1j * self.imag.value
+
+    @property
+    def shape(self) -> tuple:
+        """Shape of the batch
+
+        Returns:
+            tuple: the shape of the raw values arrays
+        """
+        return self.__re.shape
+
+    @classmethod
+    def _from_parts(cls, re: real.Array, im: real.Array) -> Array:
+        """INTERNAL USE ONLY: Build an Array from its real and imaginary parts
+
+        Args:
+            re (real.Array): real parts
+            im (real.Array): imaginary parts, aligned with re on the larger format if needed
+
+        Returns:
+            Array: a new Array holding re and im
+        """
+        if (re.bit_width, re.bit_int) != (im.bit_width, im.bit_int):
+            local_q = max(re.bit_quote, im.bit_quote)
+            local_i = max(re.bit_int, im.bit_int)
+            local_w = local_i + local_q
+            re = real.Array(re, local_w, local_i, re.signed)
+            im = real.Array(im, local_w, local_i, im.signed)
+        obj = cls.__new__(cls)
+        obj.__re = re
+        obj.__im = im
+        return obj
+
+    def __init__(self, value: any, bit_width: int = None, bit_int: int = None,
+                 signed: bool = None):
+        """Array constructor
+
+        Args:
+            - value (any): The initial values. If its type is:
+                - `Array`: real and imaginary parts are copied.
+                - a `(real.Array, real.Array)` couple: the real parts are the first
+                    value and the imaginary parts are the second value.
+                - an array-like of complex or real values: real and imaginary parts are
+                    extracted and converted to `real.Array`.
+                - any other type: see `real.Array.__init__` documentation.
+            - bit_width (`int`, optional): requested bit length.
+                See `real.Base.__init__` documentation for details. Defaults to None.
+            - bit_int (`int`, optional): requested number of integer bits.
+                See `real.Base.__init__` documentation for details. Defaults to None.
+            - signed (bool, optional): whether the elements are signed. Defaults to None,
+                i.e., the signedness of value if it is an `Array` or of its real parts if
+                it is a `(real.Array, real.Array)` couple, otherwise True.
+        """
+        if isinstance(value, Array):
+            re, im = value.real, value.imag
+        elif isinstance(value, tuple) and len(value) == 2 \
+                and all(isinstance(x, real.Array) for x in value):
+            re, im = value
+        else:
+            # pylint: disable-next=protected-access
+            values = real.Array._as_values(value)
+            re, im = values.real, values.imag
+        if signed is None:
+            signed = re.signed if isinstance(re, real.Array) else True
+        # pylint: disable=protected-access
+        re_w, re_i = real.Array._infer_shape(re, bit_width, bit_int, signed)
+        im_w, im_i = real.Array._infer_shape(im, bit_width, bit_int, signed)
+        local_i = max(re_i, im_i)
+        local_w = local_i + max(re_w - re_i, im_w - im_i)
+        self.__re = real.Array(re, local_w, local_i, signed)
+        self.__im = real.Array(im, local_w, local_i, signed)
+
+    def _coerce(self, value: any) -> Array | real.Array:
+        """INTERNAL USE ONLY: Convert an operand to an Array or a real.Array
+
+        Args:
+            value (any): operand of an arithmetic operation
+
+        Returns:
+            Array | real.Array: value itself if it already is an Array or a real.Array,
+                otherwise its conversion, scalars being broadcast as 0-d arrays.
+        """
+        if isinstance(value, (Array, real.Array)):
+            return value
+        if isinstance(value, Base):
+            return type(self)._from_parts(self.real._coerce(value.real),
+                                          self.real._coerce(value.imag))
+        if isinstance(value, real.Base):
+            return self.real._coerce(value)
+        values = numpy.asarray(value)
+        if numpy.iscomplexobj(values):
+            return type(self)(values, signed=self.signed)
+        return real.Array(values, signed=self.signed)
+
+    def __add__(self, value: any) -> Array:
+        local = self._coerce(value)
+        if isinstance(local, real.Array):
+            return self._from_parts(self.__re + local, self.__im)
+        return self._from_parts(self.__re + local.real, self.__im + local.imag)
+
+    def __sub__(self, value: any) -> Array:
+        local = self._coerce(value)
+        if isinstance(local, real.Array):
+            return self._from_parts(self.__re - local, self.__im)
+        return self._from_parts(self.__re - local.real, self.__im - local.imag)
+
+    def __mul__(self, value: any) -> Array:
+        local = self._coerce(value)
+        if isinstance(local, real.Array):
+            return self._from_parts(self.__re * local, self.__im * local)
+        local_v_re = self.__re * local.real - self.__im * local.imag
+        local_v_im = self.__re * local.imag + self.__im * local.real
+        return self._from_parts(local_v_re, local_v_im)
+
+    def __neg__(self) -> Array:
+        return self._from_parts(-self.__re, -self.__im)
+
+    def __abs__(self) -> numpy.ndarray:
+        return numpy.hypot(self.real.value, self.imag.value)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """Dispatch `numpy.absolute` (and `numpy.abs`) to the batched `__abs__`
+
+        Other ufuncs are not supported: numpy must not unpack the batch into an array of
+        scalar `Base` objects.
+        """
+        if ufunc is numpy.absolute and method == '__call__' and not kwargs:
+            return abs(inputs[0])
+        return NotImplemented
+
+    def magn(self) -> real.Array:
+        """Return the unsigned fixed-point magnitudes of the batch
+
+        Returns:
+            real.Array: The magnitudes of the complex, i.e., Re**2 + Im**2, computed as
+                `Base.magn` does.
+        """
+        local_w = 2 * self.bit_width
+        dtype   = real.Array._dtype(local_w + 1)
+        re_raw  = self.re_raw.astype(dtype, copy=False)
+        im_raw  = self.im_raw.astype(dtype, copy=False)
+        local_v = numpy.bitwise_and(re_raw * re_raw + im_raw * im_raw, (1 << local_w) - 1)
+        return real.Array._from_raw(local_v, local_w, 2 * self.bit_int, False)
+
+    def truncate(self, bits: int, lsb: bool = True) -> Array:
+        """Truncate both the real and the imaginary parts of the whole batch
+
+        Args:
+            bits (int): number of bits to truncate
+            lsb (bool, optional): truncate least-significant (right-most in binary rep.)
+                                  bits. Defaults to True.
+
+        Returns:
+            Array: A new Array with bits truncated, see `Base.truncate`
+        """
+        return self._from_parts(self.__re.truncate(bits, lsb), self.__im.truncate(bits, lsb))
+
+    def pad(self, bits: int, lsb: bool = True) -> Array:
+        """Pad both the real and imaginary parts of the whole batch
+
+        Args:
+            bits (int): number of padded bits.
+            lsb (bool, optional): pad least-significant (right-most in binary rep.) bits.
+                                  Defaults to True.
+
+        Returns:
+            Array: A new Array with bits padded, see `Base.pad`
+        """
+        return self._from_parts(self.__re.pad(bits, lsb), self.__im.pad(bits, lsb))
+
+    def saturate(self, bits: int) -> Array:
+        """Truncate most-significant bits while saturating the values of both the real
+        and imaginary parts of the whole batch
+
+        Args:
+            bits (int): MSB to be truncated
+
+        Returns:
+            Array: A new Array with bits truncated, see `Base.saturate`
+        """
+        return self._from_parts(self.__re.saturate(bits), self.__im.saturate(bits))
+
+    def __len__(self) -> int:
+        return len(self.__re)
+
+    def __getitem__(self, index) -> Base | Array:
+        local_re, local_im = self.__re[index], self.__im[index]
+        if isinstance(local_re, real.Array):
+            return self._from_parts(local_re, local_im)
+        return self.root_class((local_re, local_im))
+
+    def __repr__(self):
+        class_str = f'{self.__class__.__name__}'
+        val_str   = f'value=({self.re_raw.tolist()}, {self.im_raw.tolist()})'
+        bitw_str  = f'bit_width={self.bit_width}'
+        biti_str  = f'bit_int={self.bit_int}'
+        sign_str  = f'signed={self.signed}'
+        return class_str + '(' + ','.join([val_str, bitw_str, biti_str, sign_str]) + ')'
+
+    def __str__(self):
+        return f"{self.value} {self.bit_width}[{'S' if self.signed else 'U'}{self.bit_int}]"
@@ -1,22 +1,33 @@
 from __future__ import annotations
-import abc
 import numpy
 
 from .. import real
+from .. import _kernels
+
+# Types of the values interpreted as real values
+_REAL_TYPES = (float, int, real.Base, numpy.floating, numpy.integer)
 
 class Base:
     """Core interface to handle complex fixed-point arbitrary-precision numbers
 
     """
 
+    __slots__ = ('__re', '__im')
+
+    _ARGUMENT_MSG = "value can either be a complex value, a real value or a (real, imag) couple"
+
+    # Specialization mechanism, set by each derivative
+    _SIGNED: bool
+    _ROOT_CLASS: type
+
     @classmethod
-    @abc.abstractmethod
     def _signed(cls) -> bool:
         """Internal use only
 
         Returns:
             bool: use as a specialization mechanism
         """
+        return cls._SIGNED
 
     @property
     def signed(self) -> bool:
@@ -25,7 +36,7 @@ class Base:
         Returns:
             bool: whether the class is signed or not
         """
-        return type(self)._signed()
+        return self._SIGNED
 
     @property
     def bit_width(self) -> int:
@@ -79,7 +90,7 @@ class Base:
         Returns:
             complex: a floating-point value of the complex-number
         """
-        return self.real.value + 1j * self.imag.value
+        return complex(self.__re.value, self.__im.value)
 
     @property
     def root_class(self) -> type:
@@ -88,60 +99,171 @@ class Base:
         Returns:
             type: the underlying type of the real and imaginary parts
         """
-        return self.real.__class__
+        return self._ROOT_CLASS
+
+    @classmethod
+    def _from_raws(cls, re_raw: int, im_raw: int, bit_width: int, bit_int: int) -> Base:
+        """INTERNAL USE ONLY: Build a complex from the raw values of its parts
+
+        Args:
+            re_raw (int): raw value of the real part
+            im_raw (int): raw value of the imaginary part
+            bit_width (int): bit width of both parts
+            bit_int (int): integer bits of both parts
+
+        Returns:
+            Base: a new complex, without going through the value dispatch of `__init__`
+        """
+        # pylint: disable=protected-access
+        obj = cls.__new__(cls)
+        obj.__re = cls._ROOT_CLASS._from_raw(re_raw, bit_width, bit_int)
+        obj.__im = cls._ROOT_CLASS._from_raw(im_raw, bit_width, bit_int)
+        return obj
+
+    @classmethod
+    def _from_parts(cls, re: real.Base, im: real.Base) -> Base:
+        """INTERNAL USE ONLY: Build a complex from freshly computed real and imaginary parts
+
+        Args:
+            re (real.Base): real part, not shared with any other object
+            im (real.Base): imaginary part, not shared with any other object
+
+        Returns:
+            Base: a new complex holding re and im, without going through the value dispatch
+                of `__init__` when both parts already share the same format
+        """
+        if re.bit_width != im.bit_width or re.bit_int != im.bit_int:
+            return cls((re, im))
+        obj = cls.__new__(cls)
+        obj.__re = re
+        obj.__im = im
+        return obj
 
     def __neg__(self) -> Base:
-        return self.__class__(value = (-self.real, -self.imag),
-                              bit_width = self.bit_width + 1,
-                              bit_int = self.bit_int + 1)
+        # pylint: disable-next=protected-access
+        re_raw, bit_width, bit_int = self.__re._raw_neg()
+        return self._from_raws(re_raw, -self.__im.raw, bit_width, bit_int)
 
     def __add__(self, value, bit_width = None, bit_int = None) -> Base:
-        if isinstance(value, real.Base) or (numpy.isrealobj(value) and numpy.isscalar(value)):
-            local      = self.root_class(value = value, bit_width = bit_width, bit_int = bit_int)
-            local_v_re = self.real + local
-            local_v_im = self.imag
+        if _is_real_scalar(value):
+            # pylint: disable=protected-access
+            operand    = self._ROOT_CLASS._coerce_operand(value, bit_width, bit_int)
+            local_v_re = self.__re._add_operand(operand)
+            local_v_im = self.__im
         else:
             if isinstance(value, Base):
                 local = value
             else:
                 local = self.__class__(value=value, bit_width=bit_width, bit_int=bit_int)
-            local_v_re = self.real + local.real
-            local_v_im = self.imag + local.imag
+            local_i = max(self.bit_int, local.bit_int) + 1
+            local_q = max(self.bit_quote, local.bit_quote)
+            local_w = local_i + local_q
+            # pylint: disable=protected-access
+            raw_re, raw_im = _kernels.cadd_raw(self.__re.raw, self.__im.raw,
+                                               local_q - self.bit_quote,
+                                               local.__re.raw, local.__im.raw,
+                                               local_q - local.bit_quote)
+            if bit_width is None and bit_int is None:
+                return self._from_raws(raw_re, raw_im, local_w, local_i)
+            local_v_re = self._ROOT_CLASS(raw_re, local_w, local_i)
+            local_v_im = self._ROOT_CLASS(raw_im, local_w, local_i)
         return self.__class__((local_v_re, local_v_im), bit_width=bit_width, bit_int=bit_int)
 
     def __sub__(self, value) -> Base:
-        if isinstance(value, real.Base) or (numpy.isrealobj(value) and numpy.isscalar(value)):
-            local      = self.root_class(value = value, bit_width = None, bit_int = None)
-            local_v_re = self.__re - local
+        if _is_real_scalar(value):
+            # pylint: disable=protected-access
+            operand    = self._ROOT_CLASS._coerce_operand(value)
+            local_v_re = self.__re._sub_operand(operand)
             local_v_im = self.__im
         else:
             if isinstance(value, Base):
                 local = value
             else:
                 local = self.__class__(value = value, bit_width = None, bit_int = None)
+            local_i = max(self.bit_int, local.bit_int) + 1
+            local_q = max(self.bit_quote, local.bit_quote)
+            local_w = local_i + local_q
             # pylint: disable=protected-access
-            local_v_re = self.__re - local.__re
-            local_v_im = self.__im - local.__im
+            raw_re, raw_im = _kernels.csub_raw(self.__re.raw, self.__im.raw,
+                                               local_q - self.bit_quote,
+                                               local.__re.raw, local.__im.raw,
+                                               local_q - local.bit_quote)
+            return self._from_raws(raw_re, raw_im, local_w, local_i)
         return self.__class__(value = (local_v_re, local_v_im), bit_width = None, bit_int = None)
 
     def __mul__(self, value) -> Base:
-        if isinstance(value, real.Base) or (numpy.isrealobj(value) and numpy.isscalar(value)):
-            local    = self.root_class(value)
-            local_v_re = self.__re * local
-            local_v_im = self.__im * local
-        else:
-            if isinstance(value, Base):
-                local = value
-            else:
-                local = self.__class__(value = value, bit_width = None, bit_int = None)
+        if _is_real_scalar(value):
             # pylint: disable=protected-access
-            local_v_re = self.__re * local.__re - self.__im * local.__im
-            local_v_im = self.__re * local.__im + self.__im * local.__re
-        return self.__class__(value = (local_v_re, local_v_im), bit_width = None, bit_int = None)
+            operand = self._ROOT_CLASS._coerce_operand(value)
+            return self._from_parts(self.__re._mul_operand(operand),
+                                    self.__im._mul_operand(operand))
+        if isinstance(value, Base):
+            local = value
+        else:
+            local = self.__class__(value = value, bit_width = None, bit_int = None)
+        raw_re, raw_im = self._cmul_raws(local)
+        return self._from_raws(raw_re, raw_im,
+                               self.bit_width + local.bit_width + 1,
+                               self.bit_int + local.bit_int + 1)
+
+    def _cmul_raws(self, value: Base) -> tuple:
+        """INTERNAL USE ONLY: Raw values of the complex product by another complex
+
+        Args:
+            value (Base): right operand of the product
+
+        Returns:
+            tuple: raw values of the real and imaginary parts of the product
+        """
+        # pylint: disable=protected-access
+        if min(self.bit_width, value.bit_width) >= _kernels.CMUL3_MIN_BITS:
+            cmul = _kernels.cmul3_raw
+        else:
+            cmul = _kernels.cmul_raw
+        return cmul(self.__re.raw, self.__im.raw, value.__re.raw, value.__im.raw)
+
+    def fma(self, mul0: Base, mul1: Base) -> Base:
+        """Fused multiply-add, accumulating the product of two complex into the object
+
+        Args:
+            mul0 (Base): left operand of the product
+            mul1 (Base): right operand of the product
+
+        Returns:
+            Base: a new Base equal to `self + mul0 * mul1`, built without the intermediate
+                product when both operands are `Base`
+        """
+        if not (isinstance(mul0, Base) and isinstance(mul1, Base)):
+            return self + mul0 * mul1
+        # pylint: disable=protected-access
+        prod_re, prod_im = mul0._cmul_raws(mul1)
+        prod_w = mul0.bit_width + mul1.bit_width + 1
+        prod_i = mul0.bit_int + mul1.bit_int + 1
+        prod_q = prod_w - prod_i
+        # The product has the type of mul0, the sum the one of self
+        real.Base._validate_value(prod_re, prod_w, mul0._SIGNED)
+        real.Base._validate_value(prod_im, prod_w, mul0._SIGNED)
+        local_i = max(self.bit_int, prod_i) + 1
+        local_q = max(self.bit_quote, prod_q)
+        raw_re, raw_im = _kernels.cadd_raw(self.__re.raw, self.__im.raw,
+                                           local_q - self.bit_quote,
+                                           prod_re, prod_im, local_q - prod_q)
+        return self._from_raws(raw_re, raw_im, local_i + local_q, local_i)
 
     def __eq__(self, value: real.Base) -> bool:
         if isinstance(value, Base):
+            if value.bit_width == self.bit_width and value.bit_int == self.bit_int:
+                # pylint: disable=protected-access
+                return self.__re.raw == value.__re.raw and self.__im.raw == value.__im.raw
             local = value
+        elif isinstance(value, (complex, float, numpy.complexfloating, numpy.floating)):
+            # Same quantization as self.__class__(value), without building the complex
+            re, im = value.real, value.imag
+            local_w, local_i = self._common_shape(re, im)
+            # Both parts are built first: an unrepresentable part raises whatever the other
+            local_re = self._ROOT_CLASS(re, local_w, local_i)
+            local_im = self._ROOT_CLASS(im, local_w, local_i)
+            return self.__re == local_re and self.__im == local_im
         else:
             local = self.__class__(value)
         return self.real == local.real and self.imag == local.imag
@@ -154,13 +276,13 @@ class Base:
         return class_str + '(' + val_str + ',' + bitw_str + ',' + biti_str + ')'
 
     def __str__(self):
-        return f"{self.value} {self.bit_width}[{'S' if self.signed else 'U'}{self.bit_int}]"
+        return f"{self.value} {self.bit_width}[{'S' if self._SIGNED else 'U'}{self.bit_int}]"
 
     def __complex__(self):
-        return complex(self.value)
+        return self.value
 
     def __abs__(self):
-        return abs(complex(self))
+        return abs(self.value)
 
     def __init__(self, value: any, bit_width: int = None, bit_int: int = None):
         """Base constructor
@@ -180,7 +302,7 @@ class Base:
                     imaginary part is set to 0.
                 - a `real.Base` derivative: its raw value is copied to the real part,
                     imaginary part is set to 0.
-                - any other type: a `NotImplementedError` is raised.
+                - any other type: a `ValueError` is raised.
 
             - bit_width (`int`, optional): requested bit length. 
                 See `real.Base.__init__` documentation for details. Defaults to None.
@@ -190,41 +312,108 @@ class Base:
         Raises:
             ValueError: the type for value is not supported
         """
+        if isinstance(value, Base) and bit_width in (None, value.bit_width) \
+                and bit_int in (None, value.bit_int):
+            # Copy at the same format: the raw values are kept as-is
+            # pylint: disable=protected-access
+            root_class = self._ROOT_CLASS
+            self.__re  = root_class._from_raw(value.__re.raw, value.bit_width, value.bit_int)
+            self.__im  = root_class._from_raw(value.__im.raw, value.bit_width, value.bit_int)
+            return
+        if type(value) is tuple and len(value) == 2 \
+                and isinstance(value[0], real.Base) and isinstance(value[1], real.Base):
+            # (real, imag) couple of fixed-point parts: their raw values are copied as-is
+            # pylint: disable=protected-access
+            re, im = value
+            root_class = self._ROOT_CLASS
+            for part in value:
+                # each part must fit the requested width, as its own conversion checks it
+                real.Base._validate_value(part.raw, part.bit_width if bit_width is None
+                                          else bit_width, self._SIGNED)
+            local_w, local_i = self._common_shape(re, im, bit_width, bit_int)
+            self.__re = root_class._from_raw(re.raw, local_w, local_i)
+            self.__im = root_class._from_raw(im.raw, local_w, local_i)
+            return
         re, im = 0.0, 0.0
-        argument_error = ValueError(
-            "value can either be a complex value, a real value or a (real, imag) couple"
-        )
-        if isinstance(value, (Base, complex, numpy.complexfloating)):
+        if isinstance(value, _REAL_TYPES):
+            re = value
+        elif isinstance(value, _COMPLEX_TYPES):
             re, im = value.real, value.imag
         elif isinstance(value, (tuple, list, numpy.ndarray)):
             lenval = len(value)
-            conditions = (any(numpy.iscomplex(value)),
-                          any([isinstance(x, Base) for x in value]),
-                          (lenval not in (1, 2)))
-            if any(conditions):
-                raise argument_error
+            if lenval not in (1, 2):
+                raise ValueError(self._ARGUMENT_MSG)
+            if isinstance(value, numpy.ndarray) and value.dtype.kind != 'O':
+                # Numeric arrays only hold complex parts if their type is complex
+                if value.dtype.kind == 'c':
+                    raise ValueError(self._ARGUMENT_MSG)
+            else:
+                for part in value:
+                    if isinstance(part, _COMPLEX_TYPES):
+                        raise ValueError(self._ARGUMENT_MSG)
             re, im = value if lenval > 1 else (value[0], 0)
-        elif isinstance(value, real.Base) or numpy.isreal(value):
-            re = value
         else:
-            raise argument_error
-        root_class = real.Signed if type(self)._signed() else real.Unsigned
-        apre = root_class(re, bit_width, bit_int)
-        apim = root_class(im, bit_width, bit_int)
-        local_q = max(apre.bit_quote, apim.bit_quote)
-        local_i = max(apre.bit_int, apim.bit_int)
-        local_w = local_i + local_q
+            raise ValueError(self._ARGUMENT_MSG)
+        root_class = self._ROOT_CLASS
+        local_w, local_i = self._common_shape(re, im, bit_width, bit_int)
         self.__re = root_class(re, local_w, local_i)
         self.__im = root_class(im, local_w, local_i)
 
+    @classmethod
+    def _common_shape(cls, re: any, im: any, bit_width: int = None, bit_int: int = None) -> tuple:
+        """INTERNAL USE ONLY: Infer the format shared by the real and imaginary parts
+
+        Args:
+            re (any): initial value of the real part, see `real.Base.__init__`
+            im (any): initial value of the imaginary part, see `real.Base.__init__`
+            bit_width (int, optional): requested bit length. Defaults to None.
+            bit_int (int, optional): requested number of integer bits. Defaults to None.
+
+        Returns:
+            tuple: the (bit_width, bit_int) couple fitting both parts
+        """
+        re_w, re_i = cls._ROOT_CLASS._infer_shape(re, bit_width, bit_int)
+        im_w, im_i = cls._ROOT_CLASS._infer_shape(im, bit_width, bit_int)
+        if re_w == im_w and re_i == im_i:
+            return re_w, re_i
+        local_i = max(re_i, im_i)
+        return local_i + max(re_w - re_i, im_w - im_i), local_i
+
     def magn(self):
         """Return the unsigned fixed-point magnitude of the complex
 
         Returns:
             real.Unsigned: The magnitude of the complex, i.e., Re**2 + Im**2.
         """
-        value = self.real * self.real + self.imag * self.imag
-        return real.Unsigned(value).truncate(1, False)
+        local_w = 2 * self.bit_width
+        re_raw  = self.real.raw
+        im_raw  = self.imag.raw
+        # Re**2 + Im**2 takes 2 * bit_width + 1 bits, its MSB is truncated
+        value   = (re_raw * re_raw + im_raw * im_raw) & ((1 << local_w) - 1)
+        return real.Unsigned(value, local_w, 2 * self.bit_int)
+
+    @classmethod
+    def magn_batch(cls, re_raw: numpy.ndarray, im_raw: numpy.ndarray,
+                   bit_width: int, bit_int: int) -> real.Array:
+        """Return the magnitudes of a batch of complex given by the raw values of their parts
+
+        Args:
+            re_raw (numpy.ndarray): raw values of the real parts
+            im_raw (numpy.ndarray): raw values of the imaginary parts
+            bit_width (int): bit width of both parts
+            bit_int (int): integer bits of both parts
+
+        Returns:
+            real.Array: The unsigned magnitudes, element-wise equal to the ones of `magn`,
+                computed at once by `Array.magn`.
+        """
+        # pylint: disable-next=import-outside-toplevel,cyclic-import
+        from .ap_complex_array import Array
+        # pylint: disable=protected-access
+        batch = Array._from_parts(
+            real.Array._from_raw(numpy.asarray(re_raw), bit_width, bit_int, cls._SIGNED),
+            real.Array._from_raw(numpy.asarray(im_raw), bit_width, bit_int, cls._SIGNED))
+        return batch.magn()
 
     def truncate(self, bits: int, lsb: bool = True):
         """Truncate both the real and the imaginary parts
@@ -237,8 +426,18 @@ class Base:
         Returns:
             Base: A new Base with bits truncated and values adjusted accordingly
         """
-        return self.__class__((self.real.truncate(bits, lsb), self.imag.truncate(bits, lsb)),
-                              bit_width = None, bit_int = None)
+        if bits < 0:
+            raise ValueError('Negative truncation are not defined.')
+        re_raw, im_raw = self.__re.raw, self.__im.raw
+        local_width = self.bit_width - bits
+        if lsb:
+            return self._from_raws(re_raw >> bits, im_raw >> bits, local_width, self.bit_int)
+        # Both parts share the mask and the sign bit
+        mask     = (1 << local_width) - 1
+        sign_bit = 1 << (local_width - 1) if self._SIGNED else 0
+        re_raw   = ((re_raw & mask) ^ sign_bit) - sign_bit
+        im_raw   = ((im_raw & mask) ^ sign_bit) - sign_bit
+        return self._from_raws(re_raw, im_raw, local_width, self.bit_int - bits)
 
     def pad(self, bits: int, lsb: bool = True):
         """Pad both the real and imaginary parts
@@ -251,8 +450,7 @@ class Base:
         Returns:
             Base: depending of the sign and of lsb, a zero- or one-padded version of the object
         """
-        return self.__class__((self.real.pad(bits, lsb), self.imag.pad(bits, lsb)),
-                              bit_width = None, bit_int = None)
+        return self._from_parts(self.__re.pad(bits, lsb), self.__im.pad(bits, lsb))
 
     def saturate(self, bits: int):
         """Truncate most-significant bits while saturating the value of both the real
@@ -265,6 +463,33 @@ class Base:
             Base: a trucated version of the object, saturated if the value exceeded
                   the one achievable after truncation.
         """
-        return self.__class__(value = (self.real.saturate(bits), self.imag.saturate(bits)),
-                              bit_width = None, bit_int = None)
-    
\ No newline at end of file
+        local_width = self.bit_width - bits
+        if local_width < 1:
+            return self._from_parts(self.__re.saturate(bits), self.__im.saturate(bits))
+        # Both parts share the same bounds, which enclose 0: a clamp saturates either sign
+        # pylint: disable=protected-access
+        raw_min = self._ROOT_CLASS._min_raw_value(local_width)
+        raw_max = self._ROOT_CLASS._max_raw_value(local_width)
+        re_raw  = min(max(self.__re.raw, raw_min), raw_max)
+        im_raw  = min(max(self.__im.raw, raw_min), raw_max)
+        return self._from_raws(re_raw, im_raw, local_width, self.bit_int - bits)
+    
+
+# Types of the values interpreted as complex values
+_COMPLEX_TYPES = (complex, numpy.complexfloating, Base)
+
+def _is_real_scalar(value: any) -> bool:
+    """INTERNAL USE ONLY: Whether an operand is handled as a real scalar
+
+    Args:
+        value (any): operand of an arithmetic operation
+
+    Returns:
+        bool: True for `real.Base`, real python or numpy scalars, and any other scalar
+            deemed real by numpy (e.g., binary strings)
+    """
+    if isinstance(value, _REAL_TYPES):
+        return True
+    if isinstance(value, _COMPLEX_TYPES):
+        return False
+    return numpy.isrealobj(value) and numpy.isscalar(value)
@@ -1,3 +1,4 @@
+from .. import real
 from .ap_complex_base import Base
 
 class Unsigned(Base):
@@ -5,6 +6,15 @@ class Unsigned(Base):
 
     """
 
-    @classmethod
-    def _signed(cls):
-        return False
+    __slots__ = ()
+
+    _SIGNED     = False
+    _ROOT_CLASS = real.Unsigned
+
+    def __neg__(self) -> None:
+        """__neg__ method is blocked, as Unsigned cannot be negated
+
+        Raises:
+            NotImplementedError: Unsigned class cannot be negated
+        """
+        raise NotImplementedError(real.Unsigned._NEG_MSG)
@@ -2,13 +2,16 @@
 
 """
 
-__all__ = [ "ap_fixed", "ap_ufixed" ]
+__all__ = [ "Base", "Signed", "Unsigned", "Array",
+            "APFixed", "APUfixed", "APFixedArray" ]
 
 
 from .ap_fixed_base import Base
 from .ap_fixed import Signed
 from .ap_ufixed import Unsigned
+from .ap_fixed_array import Array
 
 # Some aliases
 APFixed = Signed
 APUfixed = Unsigned
+APFixedArray = Array
@@ -5,6 +5,10 @@ class Signed(Base):
 
     """
 
+    __slots__ = ()
+
+    _SIGNED = True
+
     @classmethod
     def _signed(cls) -> bool:
         return True
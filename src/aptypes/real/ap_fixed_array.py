@@ -0,0 +1,489 @@
+from __future__ import annotations
+import numbers
+import numpy
+
+from .ap_fixed_base import Base
+from .ap_fixed import Signed
+from .ap_ufixed import Unsigned
+
+class Array:
+    """Batch of fixed-point arbitrary-precision numbers sharing a single format
+
+    Raw values are stored as one contiguous `numpy.int64` array when the bit width
+    allows it (63 bits at most), or as an `object` array of python integers otherwise.
+
+    """
+
+    __slots__ = ('__raw', '__bit_width', '__bit_int', '__signed')
+
+    # Scalar type of the elements, indexed by signedness
+    _ROOT_CLASSES = {True: Signed, False: Unsigned}
+
+    @staticmethod
+    def _dtype(bit_width: int) -> type:
+        """Storage type of raw values
+
+        Args:
+            bit_width (int): targetted bit width
+
+        Returns:
+            type: `numpy.int64` if bit_width fits in it, otherwise `object`
+        """
+        return numpy.int64 if bit_width <= 63 else object
+
+    @property
+    def signed(self) -> bool:
+        """Signed type indicator
+
+        Returns:
+            bool: whether the elements are signed or not
+        """
+        return self.__signed
+
+    @property
+    def root_class(self) -> type:
+        """Scalar type of the elements
+
+        Returns:
+            type: the scalar `Base` derivative matching the signedness
+        """
+        return self._ROOT_CLASSES[self.__signed]
+
+    @property
+    def bit_width(self) -> int:
+        """Bit width shared by all elements
+
+        Returns:
+            int: arbitrary length in bits
+        """
+        return self.__bit_width
+
+    @property
+    def bit_int(self) -> int:
+        """Integer bits shared by all elements
+
+        Returns:
+            int: arbitrary number of bits above the fixed point
+        """
+        return self.__bit_int
+
+    @property
+    def bit_quote(self) -> int:
+        """Quotient bits shared by all elements
+
+        Returns:
+            int: arbitrary number of bits below the fixed point
+        """
+        return self.__bit_width - self.__bit_int
+
+    @property
+    def raw(self) -> numpy.ndarray:
+        """Internal raw values
+
+        Returns:
+            numpy.ndarray: internal raw values
+        """
+        return self.__raw
+
+    @property
+    def value(self) -> numpy.ndarray:
+        """Floating-point values
+
+        Returns:
+            numpy.ndarray: the equivalent floating-point values
+        """
+        return numpy.ldexp(self.__raw.astype(numpy.float64), -self.bit_quote)
+
+    @property
+    def shape(self) -> tuple:
+        """Shape of the batch
+
+        Returns:
+            tuple: the shape of the raw values array
+        """
+        return self.__raw.shape
+
+    @classmethod
+    def _validate_raw(cls, raw: numpy.ndarray, bit_width: int, signed: bool) -> None:
+        """INTERNAL USE ONLY: Validate raw values
+
+        Args:
+            raw (numpy.ndarray): raw values to validate
+            bit_width (int): targetted bit width
+            signed (bool): whether the elements are signed
+
+        Raises:
+            ValueError: bit_width is too small for at least one value
+        """
+        if raw.size == 0:
+            return
+        root_class = cls._ROOT_CLASSES[signed]
+        invalid = (raw > root_class._max_raw_value(bit_width)) \
+                | (raw < root_class._min_raw_value(bit_width))
+        if invalid.any():
+            Base._validate_value(int(raw[invalid][0]), bit_width, signed)
+
+    @classmethod
+    def _from_raw(cls, raw: numpy.ndarray, bit_width: int, bit_int: int, signed: bool) -> Array:
+        """INTERNAL USE ONLY: Build an Array from already computed raw values
+
+        Args:
+            raw (numpy.ndarray): raw values
+            bit_width (int): bit width of the values
+            bit_int (int): integer bits of the values
+            signed (bool): whether the elements are signed
+
+        Returns:
+            Array: a new Array holding raw
+        """
+        cls._validate_raw(raw, bit_width, signed)
+        obj = cls.__new__(cls)
+        obj.__raw       = raw.astype(cls._dtype(bit_width), copy=False)
+        obj.__bit_width = bit_width
+        obj.__bit_int   = bit_int
+        obj.__signed    = signed
+        return obj
+
+    def __init__(self, value: numpy.ndarray | Array,
+                 bit_width: int = None, bit_int: int = None,
+                 signed: bool = None):
+        """Array constructor
+
+        Args:
+            - value (any): The initial values. If its type is:
+                - `Array`: its values are copied, raw values being shifted if the number
+                  of quotient bits changes.
+                  When bit_width, bit_int or signed are None, their value is also copied.
+                - an array-like of floating-point values, or of real numbers that are not all
+                  integers: they are approximated.
+                  When bit_int is None, it is estimated to fit the whole batch.
+                - an array-like of integers: they are interpreted as raw values to be set as-is.
+                  bit_int is required.
+                - any other type: a `NotImplementedError` is raised.
+            - bit_width (int, optional): requested bit length, see `Base.__init__` for details.
+                Defaults to None.
+            - bit_int (int, optional): requested number of integer bits, see `Base.__init__`
+                for details. Defaults to None.
+            - signed (bool, optional): whether the elements are signed. Defaults to None,
+                i.e., the signedness of value if it is an `Array`, otherwise True.
+
+        Raises:
+            ValueError: bit_int argument missing while required
+            ValueError: bit_width is too small for at least one value
+            NotImplementedError: value type not supported
+        """
+        if isinstance(value, Array):
+            if signed is None:
+                signed = value.signed
+        else:
+            value = self._as_values(value)
+            if signed is None:
+                signed = True
+        bit_width, bit_int = self._infer_shape(value, bit_width, bit_int, signed)
+        if isinstance(value, Array):
+            shift = (bit_width - bit_int) - value.bit_quote
+            dtype = self._dtype(max(bit_width, value.bit_width + max(shift, 0)))
+            raw   = value.raw.astype(dtype, copy=False)
+            raw   = numpy.left_shift(raw, shift) if shift >= 0 else numpy.right_shift(raw, -shift)
+        elif value.dtype.kind == 'f':
+            scaled = numpy.trunc(numpy.ldexp(value, bit_width - bit_int))
+            if self._dtype(bit_width) is object or (numpy.abs(scaled) >= 2.**63).any():
+                raw = numpy.frompyfunc(int, 1, 1)(scaled).astype(object)
+            else:
+                raw = scaled.astype(numpy.int64)
+        else:
+            raw = value
+        self._validate_raw(raw, bit_width, signed)
+        self.__raw       = numpy.array(raw, dtype=self._dtype(bit_width))
+        self.__bit_width = bit_width
+        self.__bit_int   = bit_int
+        self.__signed    = signed
+
+    @staticmethod
+    def _as_values(value: any) -> numpy.ndarray:
+        """INTERNAL USE ONLY: Convert an array-like to an array of values or raw values
+
+        Args:
+            value (any): array-like of the initial values, see `__init__`
+
+        Returns:
+            numpy.ndarray: value as an array. `object` arrays of real numbers that are not
+                all integers are converted to `numpy.float64`, to be approximated.
+        """
+        value = numpy.asarray(value)
+        if value.dtype.kind == 'O' \
+                and not all(isinstance(x, numbers.Integral) for x in value.flat) \
+                and all(isinstance(x, numbers.Real) for x in value.flat):
+            return value.astype(numpy.float64)
+        return value
+
+    @staticmethod
+    def _is_raw(value: numpy.ndarray) -> bool:
+        """INTERNAL USE ONLY: Tell whether an array holds raw values
+
+        Args:
+            value (numpy.ndarray): the initial values, see `__init__`
+
+        Returns:
+            bool: True if value is an array of integers, `object` arrays being
+                checked element-wise, otherwise False
+        """
+        if value.dtype.kind == 'O':
+            return all(isinstance(x, numbers.Integral) for x in value.flat)
+        return value.dtype.kind in 'iu'
+
+    @classmethod
+    def _infer_shape(cls, value: numpy.ndarray | Array, bit_width: int = None,
+                     bit_int: int = None, signed: bool = True) -> tuple:
+        """INTERNAL USE ONLY: Infer the format of a batch, as `__init__` does
+
+        Args:
+            value (numpy.ndarray | Array): the initial values, see `__init__`
+            bit_width (int, optional): requested bit length. Defaults to None.
+            bit_int (int, optional): requested number of integer bits. Defaults to None.
+            signed (bool, optional): whether the elements are signed. Defaults to True.
+
+        Raises:
+            ValueError: some floating-point values are not finite
+            ValueError: bit_int argument missing while required
+            NotImplementedError: value type not supported
+
+        Returns:
+            tuple: the (bit_width, bit_int) couple of the batch
+        """
+        if isinstance(value, Array):
+            if bit_width is None:
+                bit_width = value.bit_width
+            if bit_int is None:
+                bit_int = value.bit_int
+        elif value.dtype.kind == 'f':
+            if not numpy.isfinite(value).all():
+                raise ValueError('Only finite values can be approximated')
+            if bit_int is None:
+                peak    = float(numpy.max(numpy.abs(value))) if value.size else 0.
+                bit_int = Base._estimate_int_width(signed, peak)
+                if (value == 0).any():
+                    bit_int = max(bit_int, Base._estimate_int_width(signed, 0.))
+            if bit_width is None:
+                bit_width = Base._estimate_width(bit_int,
+                                                 Base._estimate_quote_width(bit_int, bit_width))
+        elif cls._is_raw(value):
+            if bit_int is None:
+                raise ValueError('bit_int must be provided when using raw representation')
+            if bit_width is None:
+                bit_width = Base._estimate_width(bit_int,
+                                                 Base._estimate_quote_width(bit_int, bit_width))
+        else:
+            supported_types = ', '.join(['Array',
+                                         'array-like of floating-point values',
+                                         'array-like of integers'])
+            raise NotImplementedError(f'Currently supported type: {supported_types}')
+        return bit_width, bit_int
+
+    @classmethod
+    def from_elements(cls, values: list, bit_width: int = None, bit_int: int = None) -> Array:
+        """Gather scalar elements into a batch
+
+        Raw values are extracted in a single pass, directly into a preallocated
+        `numpy.int64` buffer when the bit width allows it.
+
+        Args:
+            values (list): sequence of `Base`, sharing the signedness of the first one.
+                Raw values of elements not matching the batch fixed point are shifted.
+            bit_width (int, optional): requested bit length. Defaults to the bit width of
+                the first element.
+            bit_int (int, optional): requested number of integer bits. Defaults to the
+                integer bits of the first element.
+
+        Raises:
+            ValueError: values is empty
+            ValueError: bit_width is too small for at least one value
+
+        Returns:
+            Array: a batch holding the values of the elements
+        """
+        if not len(values):
+            raise ValueError('At least one element is required')
+        first  = values[0]
+        signed = first.signed
+        if bit_width is None:
+            bit_width = first.bit_width
+        if bit_int is None:
+            bit_int = first.bit_int
+        bit_quote = bit_width - bit_int
+
+        def aligned_raws():
+            # raw values are aligned on the batch fixed point, as `__init__` does for an Array
+            return (x.raw << (bit_quote - x.bit_quote) if bit_quote >= x.bit_quote
+                    else x.raw >> (x.bit_quote - bit_quote) for x in values)
+
+        raw = None
+        if cls._dtype(bit_width) is numpy.int64:
+            try:
+                raw = numpy.fromiter(aligned_raws(), dtype=numpy.int64, count=len(values))
+            except OverflowError:
+                # an aligned raw value exceeds numpy.int64: the validation reports it
+                pass
+        if raw is None:
+            raw = numpy.array(list(aligned_raws()), dtype=object)
+        return cls._from_raw(raw, bit_width, bit_int, signed)
+
+    def _coerce(self, value: Array | Base | numpy.ndarray) -> Array:
+        """INTERNAL USE ONLY: Convert an operand to an Array
+
+        Args:
+            value (Array | Base | numpy.ndarray): operand of an arithmetic operation
+
+        Returns:
+            Array: value itself if it already is an Array, otherwise its Array conversion,
+                scalar `Base` being broadcast as 0-d arrays.
+        """
+        if isinstance(value, Array):
+            return value
+        if isinstance(value, Base):
+            return type(self)._from_raw(numpy.array(value.raw, dtype=self._dtype(value.bit_width)),
+                                        value.bit_width, value.bit_int, value.signed)
+        return type(self)(value, signed=self.signed)
+
+    def _aligned(self, bit_quote: int, dtype: type) -> numpy.ndarray:
+        """INTERNAL USE ONLY: Raw values aligned on a (larger) number of quotient bits
+
+        Args:
+            bit_quote (int): targetted number of quotient bits
+            dtype (type): targetted storage type
+
+        Returns:
+            numpy.ndarray: raw values left-shifted by `bit_quote - self.bit_quote`
+        """
+        return numpy.left_shift(self.__raw.astype(dtype, copy=False), bit_quote - self.bit_quote)
+
+    def __add__(self, value: Array | Base | numpy.ndarray) -> Array:
+        local       = self._coerce(value)
+        local_int   = max(self.bit_int, local.bit_int) + 1
+        local_quote = max(self.bit_quote, local.bit_quote)
+        local_width = local_int + local_quote
+        dtype       = self._dtype(local_width)
+        local_raw   = self._aligned(local_quote, dtype) + local._aligned(local_quote, dtype)
+        return self._from_raw(local_raw, local_width, local_int, self.signed)
+
+    def __sub__(self, value: Array | Base | numpy.ndarray) -> Array:
+        local       = self._coerce(value)
+        local_int   = max(self.bit_int, local.bit_int) + 1
+        local_quote = max(self.bit_quote, local.bit_quote)
+        local_width = local_int + local_quote
+        dtype       = self._dtype(local_width)
+        local_raw   = self._aligned(local_quote, dtype) - local._aligned(local_quote, dtype)
+        return self._from_raw(local_raw, local_width, local_int, self.signed)
+
+    def __mul__(self, value: Array | Base | numpy.ndarray) -> Array:
+        local       = self._coerce(value)
+        local_int   = self.bit_int + local.bit_int
+        local_width = self.bit_width + local.bit_width
+        dtype       = self._dtype(local_width)
+        local_raw   = self.__raw.astype(dtype, copy=False) * local.raw.astype(dtype, copy=False)
+        return self._from_raw(local_raw, local_width, local_int, self.signed)
+
+    def __neg__(self) -> Array:
+        if not self.signed:
+            raise NotImplementedError('Unsigned arrays cannot be negated')
+        dtype = self._dtype(self.bit_width + 1)
+        return self._from_raw(-self.__raw.astype(dtype, copy=False),
+                              self.bit_width + 1, self.bit_int + 1, self.signed)
+
+    def truncate(self, bits: int, lsb: bool = True) -> Array:
+        """Truncate arbitrary number of MSBs or LSBs of the whole batch
+
+        Args:
+            bits (int): number of bits to truncate
+            lsb (bool, optional): truncate least-significant (right-most in binary rep.) bits.
+                Defaults to True.
+
+        Raises:
+            ValueError: bits is negative, and negative truncation are not defined.
+
+        Returns:
+            Array: A new Array with bits truncated, see `Base.truncate`
+        """
+        if bits < 0:
+            raise ValueError('Negative truncation are not defined.')
+        local_width = self.bit_width - bits
+        if lsb:
+            return self._from_raw(numpy.right_shift(self.__raw, bits),
+                                  local_width, self.bit_int, self.signed)
+        local_raw = numpy.bitwise_and(self.__raw, (1 << local_width) - 1)
+        if self.signed:
+            half      = 1 << (local_width - 1)
+            local_raw = numpy.bitwise_xor(local_raw, half) - half
+        return self._from_raw(local_raw, local_width, self.bit_int - bits, self.signed)
+
+    def pad(self, bits: int, lsb: bool = True) -> Array:
+        """Pad arbitrary bits without affecting the values
+
+        Args:
+            bits (int): number of padded bits.
+            lsb (bool, optional): pad least-significant (right-most in binary rep.) bits.
+                Defaults to True.
+
+        Raises:
+            ValueError: bits is negative, and negative padding are not defined.
+
+        Returns:
+            Array: A new Array with bits padded, see `Base.pad`
+        """
+        if bits < 0:
+            raise ValueError('Negative padding are not defined.')
+        if lsb:
+            local_raw = self._aligned(self.bit_quote + bits, self._dtype(self.bit_width + bits))
+            return self._from_raw(local_raw, self.bit_width + bits, self.bit_int, self.signed)
+        return self._from_raw(self.__raw, self.bit_width + bits, self.bit_int + bits, self.signed)
+
+    def saturate(self, bits: int) -> Array:
+        """Truncate most-significant bits while saturating the values
+
+        Args:
+            bits (int): MSB to be truncated
+
+        Raises:
+            ValueError: no bit would be left after truncation
+
+        Returns:
+            Array: A new Array with bits truncated, values exceeding the ones achievable
+                after truncation being saturated, see `Base.saturate`
+        """
+        local_width = self.bit_width - bits
+        if local_width < 1:
+            raise ValueError(f'At least one bit must be left, {bits} bits cannot be saturated')
+        local_raw   = numpy.minimum(numpy.maximum(self.__raw,
+                                                  int(self.root_class._min_raw_value(local_width))),
+                                    int(self.root_class._max_raw_value(local_width)))
+        return self._from_raw(local_raw, local_width, self.bit_int - bits, self.signed)
+
+    def __len__(self) -> int:
+        return len(self.__raw)
+
+    def __getitem__(self, index) -> Base | Array:
+        raw = self.__raw[index]
+        if isinstance(raw, numpy.ndarray):
+            return self._from_raw(raw, self.bit_width, self.bit_int, self.signed)
+        return self.root_class(int(raw), self.bit_width, self.bit_int)
+
+    def to_elements(self) -> list:
+        """Split the batch into scalar elements
+
+        Returns:
+            list: the elements of the flattened batch, as `root_class` objects
+        """
+        # pylint: disable-next=protected-access
+        from_raw = self.root_class._from_raw
+        return [from_raw(raw, self.bit_width, self.bit_int) for raw in self.__raw.ravel().tolist()]
+
+    def __repr__(self):
+        class_str  = f'{self.__class__.__name__}'
+        param_strs = [f'value={self.raw.tolist()}',
+                      f'bit_width={self.bit_width}',
+                      f'bit_int={self.bit_int}',
+                      f'signed={self.signed}']
+        return class_str + '(' + ','.join(param_strs) + ')'
+
+    def __str__(self):
+        return f'{self.value} {self.bit_width}[{"S" if self.signed else "U"}{self.bit_int}]'
@@ -1,12 +1,99 @@
 from __future__ import annotations
 import abc
-import numpy
+import functools
+import math
+import numbers
+import operator
+
+from .. import _kernels
+
+@functools.lru_cache(maxsize=256)
+def _value_kind(value_type: type) -> str | None:
+    """INTERNAL USE ONLY: Cached interpretation of the values of a type by the constructor
+
+    Args:
+        value_type (type): the type of a value
+
+    Returns:
+        str | None: 'float' for real but non-integral numbers (e.g. `float` or
+            `numpy.floating`), then 'str', 'base' for `Base` derivatives, 'int' for
+            integral numbers, or None when the type is not supported
+    """
+    if issubclass(value_type, float) or (issubclass(value_type, numbers.Real)
+                                         and not issubclass(value_type, numbers.Integral)):
+        return 'float'
+    if issubclass(value_type, str):
+        return 'str'
+    if issubclass(value_type, Base):
+        return 'base'
+    if issubclass(value_type, (int, numbers.Integral)):
+        return 'int'
+    return None
+
+# Bit flips of bin_complement, 'X' placeholders being mapped to '0'
+_BIN_COMPLEMENT = str.maketrans('01X', '100')
+
+def _is_floating(value: any) -> bool:
+    """INTERNAL USE ONLY: Floating-point type indicator
+
+    Args:
+        value (any): the value to check
+
+    Returns:
+        bool: whether value is a real but non-integral number, e.g. a `float` or a
+            `numpy.floating`
+    """
+    return _value_kind(type(value)) == 'float'
+
+@functools.lru_cache(maxsize=256)
+def _pow2(exponent: int) -> int | float:
+    """INTERNAL USE ONLY: Cached power of two, as `2**exponent` computes it
+
+    Args:
+        exponent (int): the power of two
+
+    Returns:
+        int | float: an exact integer when exponent is non-negative, otherwise a float
+    """
+    return 1 << exponent if exponent >= 0 else math.ldexp(1., exponent)
+
+@functools.lru_cache(maxsize=256)
+def _pow2_float(exponent: int) -> float:
+    """INTERNAL USE ONLY: Cached floating-point power of two, as `2.**exponent` computes it
+
+    Args:
+        exponent (int): the power of two
+
+    Returns:
+        float: the power of two
+    """
+    return math.ldexp(1., exponent)
+
+@functools.lru_cache(maxsize=256)
+def _raw_bounds(bit_width: int, signed: bool) -> tuple:
+    """INTERNAL USE ONLY: Cached raw value range of a format
+
+    Args:
+        bit_width (int): targetted bit width
+        signed (bool): whether the format is signed
+
+    Returns:
+        tuple: the (minimum, maximum) raw values achievable
+    """
+    signed = int(signed)
+    return -_pow2(bit_width - signed) * signed, _pow2(bit_width - signed) - 1
 
 class Base(abc.ABC):
     """Core interface to handle fixed-point arbitrary-precision numbers
 
     """
 
+    # __bin caches the binary word: it is only set on the first bin access
+    __slots__ = ('__v', '__bit_width', '__bit_int', '__bit_quote', '__scaling_method', '__bin')
+
+    # Specialization mechanism, set by each derivative along with _signed
+    _SIGNED: bool
+
     @classmethod
     @abc.abstractmethod
     def _signed(cls) -> bool:
@@ -15,7 +102,6 @@ class Base(abc.ABC):
         Returns:
             bool: use as a specialization mechanism
         """
-        pass
 
     @property
     def signed(self) -> bool:
@@ -24,7 +110,7 @@ class Base(abc.ABC):
         Returns:
             bool: whether the class is signed or not
         """
-        return type(self)._signed()
+        return self._SIGNED
 
     @property
     def bit_width(self) -> int:
@@ -64,10 +150,17 @@ class Base(abc.ABC):
 
     @raw.setter
     def raw(self, value: int):
-        if not isinstance(value, int):
-            raise ValueError("Only int type is supported")
-        self._validate_value(value, self.bit_width, self.signed)
+        try:
+            # accepts any integer type, e.g. `numpy.integer`, stored as a python int
+            value = operator.index(value)
+        except TypeError as error:
+            raise ValueError("Only int type is supported") from error
+        self._validate_value(value, self.bit_width, self._SIGNED)
         self.__v = value
+        try:
+            del self.__bin
+        except AttributeError:
+            pass
 
     @property
     def bin(self) -> str:
@@ -76,11 +169,12 @@ class Base(abc.ABC):
         Returns:
             str: internal binary value, as a python string
         """
-        isneg  = self.raw < 0
-        value  = abs(self.raw) - 1 if isneg else self.raw
-        common = ('{0:0%db}' % self.bit_width).format(value)
-        binrep = common.replace('1','X').replace('0','1').replace('X', '0') if isneg else common
-        return binrep
+        try:
+            return self.__bin
+        except AttributeError:
+            bit_width  = self.__bit_width
+            self.__bin = format(self.__v & ((1 << bit_width) - 1), f'0{bit_width}b')
+            return self.__bin
 
     @staticmethod
     def bin_complement(binrep: str) -> str:
@@ -92,14 +186,14 @@ class Base(abc.ABC):
         Returns:
             str: the two-complement of binrep
         """
-        return '-' + binrep.replace('1','X').replace('0','1').replace('X', '0')
+        return '-' + binrep.translate(_BIN_COMPLEMENT)
 
     @bin.setter
     def bin(self, binrep: str):
         if len(binrep) != self.__bit_width:
             raise ValueError(f'Binary word length must be {self.__bit_width}')
-        ispos    = binrep[0] == '0'
-        self.raw = int(binrep, 2) if ispos else int(self.bin_complement(binrep), 2)
+        value    = int(binrep, 2)
+        self.raw = value - (1 << self.__bit_width) if self._SIGNED and binrep[0] == '1' else value
     @classmethod
     def _max_raw_value(cls, bit_width: int) -> int:
         """Compute the maximum raw value achievable by this class for bit_width bits
@@ -110,7 +204,7 @@ class Base(abc.ABC):
         Returns:
             int: maximum raw value achievable
         """
-        return 2**(bit_width - int(cls._signed())) - 1
+        return _raw_bounds(bit_width, cls._SIGNED)[1]
 
     @property
     def max_raw_value(self) -> int:
@@ -119,7 +213,7 @@ class Base(abc.ABC):
         Returns:
             int: Maximum raw value achievable for the current object
         """
-        return type(self)._max_raw_value(self.bit_width)
+        return _raw_bounds(self.__bit_width, self._SIGNED)[1]
 
     @classmethod
     def _min_raw_value(cls, bit_width) -> int:
@@ -131,8 +225,7 @@ class Base(abc.ABC):
         Returns:
             int: minimum raw value achievable
         """
-        svalue = int(cls._signed())
-        return  -2**(bit_width - svalue) * svalue
+        return _raw_bounds(bit_width, cls._SIGNED)[0]
 
     @property
     def min_raw_value(self) -> int:
@@ -141,7 +234,7 @@ class Base(abc.ABC):
         Returns:
             int: Minimum raw value achievable for the current object
         """
-        return type(self)._min_raw_value(self.bit_width)
+        return _raw_bounds(self.__bit_width, self._SIGNED)[0]
 
     @property
     def precision(self) -> float:
@@ -151,7 +244,7 @@ class Base(abc.ABC):
             int: the fixed-point precison quantum, the smallest value that
                 can be represented accuratly
         """
-        return 2.**(-self.bit_quote)
+        return _pow2_float(-self.bit_quote)
 
     @property
     def value(self) -> float:
@@ -161,13 +254,13 @@ class Base(abc.ABC):
             int: the equivalent floating-point value, based on the fixed point
                 position and assuming a linear binary conversion
         """
-        return self.raw * 2.**(-self.bit_quote)
+        return math.ldexp(self.__v, -self.__bit_quote)
 
     @value.setter
     def value(self, value: float) -> None:
-        if not isinstance(value, (float, numpy.floating)):
+        if not _is_floating(value):
             raise ValueError("require a floating point value")
-        self.raw = int(value * 2**(self.bit_quote))
+        self.raw = int(math.ldexp(value, self.bit_quote))
 
     @property
     def max_value(self) -> float:
@@ -176,7 +269,7 @@ class Base(abc.ABC):
         Returns:
             float: maximum floating point value achievable
         """
-        return self.max_raw_value * 2.**(-self.bit_quote)
+        return math.ldexp(self.max_raw_value, -self.__bit_quote)
 
     @property
     def min_value(self) -> float:
@@ -185,7 +278,7 @@ class Base(abc.ABC):
         Returns:
             float: minimum floating point value achievable
         """
-        return self.min_raw_value * 2.**(-self.bit_quote)
+        return math.ldexp(self.min_raw_value, -self.__bit_quote)
 
     @property
     def scaling(self) -> str:
@@ -208,7 +301,16 @@ class Base(abc.ABC):
             int: an estimation of the minimum bit_int required to
                 store the integer part of the value
         """
-        return int(numpy.log2(abs(value) + value.__class__(not value))) + 1 + int(signed)
+        if not value:
+            return 1 + int(signed)
+        if isinstance(value, (int, numbers.Integral)):
+            return abs(int(value)).bit_length() + int(signed)
+        # int(log2(|value|)) + 1, where int() truncates toward zero: below 1, only
+        # exact powers of two do not round up
+        mantissa, exponent = math.frexp(abs(value))
+        if exponent <= 0 and mantissa != .5:
+            exponent += 1
+        return exponent + int(signed)
 
     @staticmethod
     def _estimate_width(bit_int: int, bit_quote: int) -> int:
@@ -224,6 +326,7 @@ class Base(abc.ABC):
         return bit_int + bit_quote
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _estimate_quote_width(bit_int: int, bit_width: int | None) -> int:
         """Estimation of the number of quotient bit
 
@@ -256,10 +359,62 @@ class Base(abc.ABC):
         """
         if not isinstance(value, int):
             raise ValueError("Value must be an int")
-        if value > 2**(bit_width - signed) - 1 or value < (-2**(bit_width - signed) * signed):
+        min_value, max_value = _raw_bounds(bit_width, signed)
+        if not min_value <= value <= max_value:
             str_sign = ' signed' if signed else 'n unsigned'
             raise ValueError(f"A{str_sign} of {bit_width} bits cannot hold the value {value}")
 
+    @classmethod
+    def _infer_shape(cls, value: float | str | int | Base,
+                     bit_width: int = None, bit_int: int = None) -> tuple:
+        """Infer the bit width and integer bits the constructor selects for a value,
+        without building any object
+
+        Args:
+            value (float | str | int | Base): the initial value, see `__init__`
+            bit_width (int, optional): requested bit length. Defaults to None.
+            bit_int (int, optional): requested number of integer bits. Defaults to None.
+
+        Raises:
+            ValueError: bit_int argument missing while required
+            NotImplementedError: value type not supported
+
+        Returns:
+            tuple: the (bit_width, bit_int) couple
+        """
+        kind = _value_kind(type(value))
+        if kind == 'float':
+            if bit_int is None:
+                bit_int = cls._estimate_int_width(cls._SIGNED, value)
+            if bit_width is None:
+                bit_width = cls._estimate_width(bit_int,
+                                                cls._estimate_quote_width(bit_int, bit_width))
+        elif kind == 'str':
+            if bit_int is None:
+                raise ValueError('bit_int must be provided when using binary representation')
+            if bit_width is None:
+                bit_width = len(value)
+        elif kind == 'base':
+            if bit_width is None:
+                bit_width = value.bit_width
+            if bit_int is None:
+                bit_int = value.bit_int
+        elif kind == 'int':
+            if bit_int is None:
+                raise ValueError('bit_int must be provided when using raw representation')
+            if bit_width is None:
+                bit_width = cls._estimate_width(bit_int,
+                                                cls._estimate_quote_width(bit_int, bit_width))
+        else:
+            supported_types = ', '.join(['float',
+                                         'numbers.Real',
+                                         'int',
+                                         'numbers.Integral',
+                                         'str',
+                                         'Base'])
+            raise NotImplementedError(f'Currently supported type: {supported_types}')
+        return bit_width, bit_int
+
     def __init__(self, value: float | str | int | Base,
                  bit_width: int = None, bit_int: int = None,
                  **kwargs):
@@ -291,74 +446,114 @@ class Base(abc.ABC):
             ValueError: bit_int argument missing while required
             NotImplementedError: value type not supported
         """
-        if 'scaling' in kwargs:
-            self.__scaling_method = kwargs['scaling']
-        else:
-            self.__scaling_method = 'internal'
-        if isinstance(value, (float, numpy.floating)):
-            if bit_int is None:
-                bit_int = self._estimate_int_width(self.signed, value)
-            bit_quote = self._estimate_quote_width(bit_int, bit_width)
-            if bit_width is None:
-                bit_width = self._estimate_width(bit_int, bit_quote)
-            value = int(value * 2**bit_quote)
-        elif isinstance(value, str):
-            if bit_int is None:
-                raise ValueError('bit_int must be provided when using binary representation')
-            if bit_width is None:
-                bit_width = len(value)
-            bit_quote  = self._estimate_quote_width(bit_int, bit_width)
-            ispos     = value[0] == '0'
-            neg_value = int(value[1:], 2) - int('1' + '0'*(bit_width - 1), 2)
+        self.__scaling_method = kwargs.get('scaling', 'internal')
+        bit_width, bit_int = self._infer_shape(value, bit_width, bit_int)
+        bit_quote = bit_width - bit_int
+        kind     = _value_kind(type(value))
+        in_range = False
+        if kind == 'float':
+            value = int(math.ldexp(value, bit_quote))
+        elif kind == 'str':
             pos_value = int(value, 2)
-            value = pos_value if (ispos or not self.signed) else neg_value
-        elif issubclass(value.__class__, Base):
-            if bit_width is None:
-                bit_width = value.bit_width
-            if bit_int is None:
-                bit_int = value.bit_int
-            bit_quote = self._estimate_quote_width(bit_int, bit_width)
-            value     = value.raw
-        elif isinstance(value, (int, numpy.integer)):
-            if bit_int is None:
-                raise ValueError('bit_int must be provided when using raw representation')
-            bit_quote = self._estimate_quote_width(bit_int, bit_width)
-            if bit_width is None:
-                bit_width = self._estimate_width(bit_int, bit_quote)
-            value = int(value)
+            if self._SIGNED and value[0] == '1':
+                # the sign bit of the word weighs -2**(bit_width - 1)
+                value = pos_value - (1 << (len(value) - 1)) - (1 << (bit_width - 1))
+            else:
+                value = pos_value
+        elif kind == 'base':
+            # a copy on the same number of bits and with the same sign is in range
+            in_range = bit_width == value.__bit_width and self._SIGNED == value._SIGNED
+            value    = value.__v
         else:
-            supported_types = ', '.join(['float',
-                                         'numpy.floating',
-                                         'int',
-                                         'numpy.integer',
-                                         'str',
-                                         'Base'])
-            raise NotImplementedError(f'Currently supported type: {supported_types}')
-        self._validate_value(value, bit_width, int(self.signed))
+            value = int(value)
+        if not in_range:
+            self._validate_value(value, bit_width, self._SIGNED)
         self.__v         = value
         self.__bit_width = bit_width
         self.__bit_int   = bit_int
         self.__bit_quote = bit_quote
 
+    @classmethod
+    def _from_raw(cls, raw: int, bit_width: int, bit_int: int) -> Base:
+        """INTERNAL USE ONLY: Build an object from an already computed raw value
+
+        Args:
+            raw (int): raw value, as a pure python integer
+            bit_width (int): bit width of the value
+            bit_int (int): integer bits of the value
+
+        Raises:
+            ValueError: bit_width is too small for raw
+
+        Returns:
+            Base: a new object holding raw, without going through the value dispatch
+                of `__init__`
+        """
+        cls._validate_value(raw, bit_width, cls._SIGNED)
+        obj = cls.__new__(cls)
+        obj.__v              = raw
+        obj.__bit_width      = bit_width
+        obj.__bit_int        = bit_int
+        obj.__bit_quote      = bit_width - bit_int
+        obj.__scaling_method = 'internal'
+        return obj
+
+    @classmethod
+    def from_array(cls, values: any, bit_width: int = None, bit_int: int = None):
+        """Approximate a whole batch of floating-point values at once
+
+        Args:
+            values (numpy.ndarray): array-like of values to approximate, converted to
+                `numpy.float64` (integers are values here, not raw values).
+            bit_width (int, optional): requested bit length, see `__init__`. Defaults to None.
+            bit_int (int, optional): requested number of integer bits, see `__init__`.
+                When None, it is estimated to fit the whole batch. Defaults to None.
+
+        Returns:
+            Array: a batch of elements of this class, sharing a single format
+        """
+        # pylint: disable-next=import-outside-toplevel
+        import numpy
+        # pylint: disable-next=import-outside-toplevel,cyclic-import
+        from .ap_fixed_array import Array
+        return Array(numpy.asarray(values, dtype=numpy.float64), bit_width, bit_int, cls._SIGNED)
+
     def __add__(self, value: float | str | int | Base,
                 bit_width: int = None, bit_int: int = None) -> Base:
         if isinstance(value, Base):
-            local = value
+            operand = (value.__v, value.__bit_width, value.__bit_int)
         else:
-            local = self.__class__(value, bit_width, bit_int)
-        local_int = max(self.bit_int, local.bit_int) + 1 if bit_int is None else bit_int
+            operand = self._coerce_operand(value, bit_width, bit_int)
+        return self._add_operand(operand, bit_width, bit_int)
+
+    def _add_operand(self, operand: tuple, bit_width: int = None, bit_int: int = None) -> Base:
+        """INTERNAL USE ONLY: Addition of an already converted operand
+
+        Args:
+            operand (tuple): (raw, bit_width, bit_int) triplet of the operand,
+                see `_coerce_operand`
+            bit_width (int, optional): requested bit length of the result. Defaults to None.
+            bit_int (int, optional): requested number of integer bits of the result.
+                Defaults to None.
+
+        Returns:
+            Base: the result of the addition, see `__add__`
+        """
+        raw, width, integer = operand
+        quote     = width - integer
+        local_int = max(self.__bit_int, integer) + 1 if bit_int is None else bit_int
         if bit_width is None:
-            local_quote = max(self.bit_quote, local.bit_quote)
+            local_quote = max(self.__bit_quote, quote)
             local_width = local_int + local_quote
         else:
             local_width = bit_width
             local_quote = local_width - local_int
-        if self.scaling == 'internal':
-            scales      = [2**(local_quote - self.bit_quote), 2**(local_quote - local.bit_quote)]
-            local_value = int(self.raw * scales[0]) + int(local.raw * scales[1])
+        if self.__scaling_method == 'internal':
+            local_value = _kernels.add_raw(self.__v, local_quote - self.__bit_quote,
+                                           raw, local_quote - quote)
         else:
-            local_value = self.raw + local.raw
-        return self.__class__(local_value, local_width, local_int)
+            local_value = self.__v + raw
+        return self._from_raw(local_value, local_width, local_int)
 
     def bitstrained_add(self, value: float | str | int | Base,
                        bit_width: int , bit_int: int = None) -> Base:
@@ -378,22 +573,39 @@ class Base(abc.ABC):
     def __sub__(self, value: float | str | int | Base,
                 bit_width: int = None, bit_int: int = None) -> Base:
         if isinstance(value, Base):
-            local = value
+            operand = (value.__v, value.__bit_width, value.__bit_int)
         else:
-            local = self.__class__(value, bit_width, bit_int)
-        local_int = max(self.bit_int, local.bit_int) + 1 if bit_int is None else bit_int
+            operand = self._coerce_operand(value, bit_width, bit_int)
+        return self._sub_operand(operand, bit_width, bit_int)
+
+    def _sub_operand(self, operand: tuple, bit_width: int = None, bit_int: int = None) -> Base:
+        """INTERNAL USE ONLY: Substraction of an already converted operand
+
+        Args:
+            operand (tuple): (raw, bit_width, bit_int) triplet of the operand,
+                see `_coerce_operand`
+            bit_width (int, optional): requested bit length of the result. Defaults to None.
+            bit_int (int, optional): requested number of integer bits of the result.
+                Defaults to None.
+
+        Returns:
+            Base: the result of the substraction, see `__sub__`
+        """
+        raw, width, integer = operand
+        quote     = width - integer
+        local_int = max(self.__bit_int, integer) + 1 if bit_int is None else bit_int
         if bit_width is None:
-            local_quote = max(self.bit_quote, local.bit_quote)
+            local_quote = max(self.__bit_quote, quote)
             local_width = local_int + local_quote
         else:
             local_width = bit_width
             local_quote = local_width - local_int
-        if self.scaling == 'internal':
-            scales = [2**(local_quote - self.bit_quote), 2**(local_quote - local.bit_quote)]
-            local_value = int(self.raw * scales[0]) - int(local.raw * scales[1])
+        if self.__scaling_method == 'internal':
+            local_value = _kernels.sub_raw(self.__v, local_quote - self.__bit_quote,
+                                           raw, local_quote - quote)
         else:
-            local_value = self.raw - local.raw
-        return self.__class__(local_value, local_width, local_int)
+            local_value = self.__v - raw
+        return self._from_raw(local_value, local_width, local_int)
 
     def bitstrained_sub(self, value: float | str | int | Base,
                        bit_width: int, bit_int: int = None) -> Base:
@@ -413,18 +625,31 @@ class Base(abc.ABC):
     def __mul__(self, value: float | str | int | Base,
                 bit_width: int = None, bit_int: int = None) -> Base:
         if isinstance(value, Base):
-            local = value
+            operand = (value.__v, value.__bit_width, value.__bit_int)
         else:
-            local = self.__class__(value, bit_width, bit_int)
-        local_int = self.bit_int + local.bit_int if bit_int is None else bit_int
+            operand = self._coerce_operand(value, bit_width, bit_int)
+        return self._mul_operand(operand, bit_width, bit_int)
+
+    def _mul_operand(self, operand: tuple, bit_width: int = None, bit_int: int = None) -> Base:
+        """INTERNAL USE ONLY: Multiplication by an already converted operand
+
+        Args:
+            operand (tuple): (raw, bit_width, bit_int) triplet of the operand,
+                see `_coerce_operand`
+            bit_width (int, optional): requested bit length of the result. Defaults to None.
+            bit_int (int, optional): requested number of integer bits of the result.
+                Defaults to None.
+
+        Returns:
+            Base: the result of the multiplication, see `__mul__`
+        """
+        raw, width, integer = operand
+        local_int = self.__bit_int + integer if bit_int is None else bit_int
         if bit_width is None:
-            local_quote = self.bit_quote + local.bit_quote
-            local_width = local_int + local_quote
+            local_width = local_int + self.__bit_quote + width - integer
         else:
             local_width = bit_width
-            local_quote = local_width - local_int
-        local_value = self.raw * local.raw
-        return self.__class__(value=local_value, bit_width=local_width, bit_int=local_int)
+        return self._from_raw(_kernels.mul_raw(self.__v, raw), local_width, local_int)
 
     def bitstrained_mul(self, value: float | str | int | Base,
                        bit_width: int, bit_int: int = None) -> Base:
@@ -441,32 +666,95 @@ class Base(abc.ABC):
         # pylint: disable-next=unnecessary-dunder-call
         return self.__mul__(value, bit_width, bit_int)
 
+    def square(self) -> Base:
+        """Multiply the object by itself
+
+        Returns:
+            Base: the square, with the format of `self * self`, computed without
+                the operand conversion and width negotiation of `__mul__`.
+        """
+        return self._from_raw(self.__v * self.__v, 2 * self.__bit_width, 2 * self.__bit_int)
+
+    def _raw_neg(self) -> tuple:
+        """INTERNAL USE ONLY: Negation without building the result
+
+        Returns:
+            tuple: the (raw, bit_width, bit_int) triplet of the negated value, one bit wider
+                so that the most negative raw value can be negated
+        """
+        return -self.__v, self.__bit_width + 1, self.__bit_int + 1
+
     def __neg__(self) -> Base:
-        return self.__class__(-self.raw, self.__bit_width + 1, self.bit_int + 1)
+        return self._from_raw(*self._raw_neg())
 
-    def __lt__(self, value: Base, bit_width: int = None, bit_int: int = None) -> bool:
+    @classmethod
+    def _coerce_operand(cls, value: float | str | int | Base,
+                        bit_width: int = None, bit_int: int = None) -> tuple:
+        """INTERNAL USE ONLY: Raw value and format of an arithmetic operand
+
+        Args:
+            value (float | str | int | Base): the operand, see `__init__`
+            bit_width (int, optional): requested bit length. Defaults to None.
+            bit_int (int, optional): requested number of integer bits. Defaults to None.
+
+        Returns:
+            tuple: the (raw, bit_width, bit_int) triplet `cls(value, bit_width, bit_int)` would
+                hold, floating-point values being quantized without building the object
+        """
+        if _is_floating(value):
+            bit_width, bit_int = cls._infer_shape(value, bit_width, bit_int)
+            raw = int(math.ldexp(value, bit_width - bit_int))
+            cls._validate_value(raw, bit_width, cls._SIGNED)
+            return raw, bit_width, bit_int
+        local = cls(value, bit_width, bit_int)
+        return local.__v, local.__bit_width, local.__bit_int
+
+    @classmethod
+    def _coerce_raw(cls, value: float | str | int | Base,
+                    bit_width: int = None, bit_int: int = None) -> tuple:
+        """INTERNAL USE ONLY: Raw value and quotient bits of a comparison operand
+
+        Args:
+            value (float | str | int | Base): the operand, see `__init__`
+            bit_width (int, optional): requested bit length. Defaults to None.
+            bit_int (int, optional): requested number of integer bits. Defaults to None.
+
+        Returns:
+            tuple: the (raw, bit_quote) couple `cls(value, bit_width, bit_int)` would hold,
+                floating-point values being quantized without building the object
+        """
         if isinstance(value, Base):
-            local = value
-        else:
-            local = self.__class__(value, bit_width, bit_int)
-        scale = 2**(self.bit_quote - local.bit_quote) if self.scaling == 'internal' else 1
-        return self.raw < local.raw * scale
+            return value.raw, value.bit_quote
+        raw, bit_width, bit_int = cls._coerce_operand(value, bit_width, bit_int)
+        return raw, bit_width - bit_int
+
+    def _aligned_raw(self, raw: int, bit_quote: int) -> int | float:
+        """INTERNAL USE ONLY: Align a comparison operand on the fixed point of the object
+
+        Args:
+            raw (int): raw value of the operand
+            bit_quote (int): quotient bits of the operand
+
+        Returns:
+            int | float: raw scaled by `2**(self.bit_quote - bit_quote)`, using a shift when
+                the power is non-negative
+        """
+        if self.__scaling_method != 'internal':
+            return raw
+        shift = self.__bit_quote - bit_quote
+        return raw << shift if shift >= 0 else raw * _pow2(shift)
+
+    def __lt__(self, value: Base, bit_width: int = None, bit_int: int = None) -> bool:
+        return self.__v < self._aligned_raw(*self._coerce_raw(value, bit_width, bit_int))
 
     def __gt__(self, value: Base, bit_width: int = None, bit_int: int = None) -> bool:
-        if isinstance(value, Base):
-            local = value
-        else:
-            local = self.__class__(value, bit_width, bit_int)
-        scale = 2**(self.bit_quote - local.bit_quote) if self.scaling == 'internal' else 1
-        return self.raw > local.raw * scale
+        return self.__v > self._aligned_raw(*self._coerce_raw(value, bit_width, bit_int))
 
     def __eq__(self, value: Base) -> bool:
-        if isinstance(value, Base):
-            local = value
-        else:
-            local = self.__class__(value)
-        scale = 2.**(self.bit_quote - local.bit_quote) if self.scaling == 'internal' else 1
-        return self.raw == local.raw * scale
+        raw, bit_quote = self._coerce_raw(value)
+        if bit_quote == self.__bit_quote or self.__scaling_method != 'internal':
+            return self.__v == raw
+        return self.__v == raw * _pow2_float(self.__bit_quote - bit_quote)
 
     def truncate(self, bits: int, lsb: bool = True) -> Base:
         """Truncate arbitrary number of MSBs or LSBs 
@@ -484,13 +772,13 @@ class Base(abc.ABC):
         """
         if bits < 0:
             raise ValueError('Negative truncation are not defined.')
+        local_width = self.__bit_width - bits
         if lsb:
-            return self.__class__(self.bin[:-bits],
-                self.bit_width - bits,
-                self.bit_int)
-        return self.__class__(self.bin[bits:],
-            self.bit_width - bits,
-            self.bit_int - bits)
+            return self._from_raw(self.__v >> bits, local_width, self.__bit_int)
+        local_value = self.__v & ((1 << local_width) - 1)
+        if self._SIGNED and local_value >> (local_width - 1):
+            local_value -= 1 << local_width
+        return self._from_raw(local_value, local_width, self.__bit_int - bits)
 
 
     def pad(self, bits: int, lsb: bool = True) -> Base:
@@ -501,19 +789,17 @@ class Base(abc.ABC):
             lsb (bool, optional): pad least-significant (right-most in binary rep.) bits.
                 Defaults to True.
 
+        Raises:
+            ValueError: bits is negative, and negative padding are not defined.
+
         Returns:
             Base: depending of the sign and of lsb, a zero- or one-padded version of the object
         """
+        if bits < 0:
+            raise ValueError('Negative padding are not defined.')
         if lsb:
-            return self.__class__(
-                self.bin + '0' * bits,
-                self.__bit_width + bits,
-                self.bit_int)
-        sign_str = self.bin[0] if self.signed else '0'
-        return self.__class__(
-            sign_str * bits + self.bin,
-            self.__bit_width + bits,
-            self.bit_int + bits)
+            return self._from_raw(self.__v << bits, self.__bit_width + bits, self.__bit_int)
+        return self._from_raw(self.__v, self.__bit_width + bits, self.__bit_int + bits)
 
     @classmethod
     def _saturate_high(cls, value, bit_width) -> int:
@@ -533,17 +819,13 @@ class Base(abc.ABC):
             Base: a trucated version of the object, saturated if the value exceeded
                 the one achievable after truncation.
         """
-        local_width = self.bit_width - bits
-        local_int = self.bit_int - bits
-        if self.raw >= 0:
-            return self.__class__(
-                self._saturate_high(self.raw, local_width),
-                local_width,
-                local_int)
-        return self.__class__(
-            self._saturate_low(self.raw, local_width),
-            local_width,
-            local_int)
+        local_width = self.__bit_width - bits
+        raw_min, raw_max = _raw_bounds(local_width, self._SIGNED)
+        if self.__v >= 0:
+            local_value = int(min(self.__v, raw_max))
+        else:
+            local_value = int(max(self.__v, raw_min))
+        return self._from_raw(local_value, local_width, self.__bit_int - bits)
 
     def __repr__(self):
         class_str  = f'{self.__class__.__name__}'
@@ -553,7 +835,7 @@ class Base(abc.ABC):
         return class_str + '(' + ','.join(param_strs) + ')'
 
     def __str__(self):
-        return f'{self.value} {self.bit_width}[{"S" if self.signed else "U"}{self.bit_int}]'
+        return f'{self.value} {self.bit_width}[{"S" if self._SIGNED else "U"}{self.bit_int}]'
 
     def __float__(self):
         return self.value
@@ -5,6 +5,11 @@ class Unsigned(Base):
 
     """
 
+    __slots__ = ()
+
+    _SIGNED  = False
+    _NEG_MSG = 'Unsigned class cannot be negated'
+
     @classmethod
     def _signed(cls) -> bool:
         return False
@@ -15,4 +20,4 @@ class Unsigned(Base):
         Raises:
             NotImplementedError: Unsigned class cannot be negated
         """
-        raise NotImplementedError(f'{self.__class__.__name__} class cannot be negated')
+        raise NotImplementedError(self._NEG_MSG)